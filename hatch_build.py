@@ -0,0 +1,49 @@
+"""Hatch build hook that compiles the XML config parser with Cython when available.
+
+xml_parser.py is written in Cython's pure Python mode, so the module works
+unchanged without a compiler. When Cython and setuptools are importable at
+build time (e.g. `pip install cython setuptools` followed by a build with
+`--no-build-isolation`), wheels ship a compiled extension next to the .py,
+which Python's import system prefers. Otherwise the build stays pure Python.
+"""
+
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+CYTHON_MODULES = ["uv_aix_agent/core/xml_parser.py"]
+
+
+class CythonBuildHook(BuildHookInterface):
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version, build_data):
+        if self.target_name != "wheel":
+            return
+
+        try:
+            from Cython.Build import cythonize
+            from setuptools import Distribution
+            from setuptools.command.build_ext import build_ext
+        except ImportError:
+            return
+
+        root = Path(self.root)
+        ext_modules = cythonize(
+            [str(root / module) for module in CYTHON_MODULES],
+            build_dir=str(root / "build" / "cython"),
+            compiler_directives={"language_level": 3},
+            quiet=True,
+        )
+        command = build_ext(Distribution({"ext_modules": ext_modules}))
+        command.build_lib = str(root / "build" / "lib")
+        command.build_temp = str(root / "build" / "temp")
+        command.ensure_finalized()
+        command.run()
+
+        # Build outside the source tree so a stale extension never shadows edits to the .py
+        for ext in ext_modules:
+            built = Path(command.get_ext_fullpath(ext.name))
+            build_data["force_include"][str(built)] = built.relative_to(command.build_lib).as_posix()
+        build_data["pure_python"] = False
+        build_data["infer_tag"] = True
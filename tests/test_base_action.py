@@ -0,0 +1,65 @@
+"""Tests for merging parallel action results into the parent context."""
+
+import asyncio
+import unittest
+
+from uv_aix_agent.actions.base_action import ActionContext, BaseAction, ParallelAction
+
+
+class SetValues(BaseAction):
+    """Action that writes fixed values into the context."""
+
+    def __init__(self, name, values):
+        super().__init__(name)
+        self.values = values
+
+    def execute(self, context):
+        context.update(self.values)
+        return context
+
+
+class Noop(BaseAction):
+    """Action that leaves its copy of the context untouched."""
+
+    def execute(self, context):
+        return context
+
+
+def make_context():
+    return ActionContext(
+        data={'count': 0},
+        config={},
+        tools={},
+        metadata={},
+        raw_data={'state': 'old'}
+    )
+
+
+class ParallelMergeTest(unittest.TestCase):
+    def make_action(self):
+        # The writer comes first, so an unchanged sibling merged after it must not undo its writes
+        return ParallelAction('parallel', [
+            SetValues('writer', {'count': 1, 'raw_data': {'state': 'new'}}),
+            Noop('reader')
+        ])
+
+    def assert_writer_wins(self, context):
+        self.assertEqual(context.get('count'), 1)
+        self.assertEqual(context.get('raw_data'), {'state': 'new'})
+
+    def test_untouched_sibling_does_not_overwrite(self):
+        self.assert_writer_wins(self.make_action().execute(make_context()))
+
+    def test_untouched_sibling_does_not_overwrite_async(self):
+        self.assert_writer_wins(asyncio.run(self.make_action().aexecute(make_context())))
+
+    def test_later_writer_wins_conflicts(self):
+        action = ParallelAction('parallel', [
+            SetValues('first', {'count': 1}),
+            SetValues('second', {'count': 2})
+        ])
+        self.assertEqual(action.execute(make_context()).get('count'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Tests for the bash command and file system tools."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from uv_aix_agent.tools import bash_tool
+from uv_aix_agent.tools.bash_tool import BashCommandTool, FileSystemTool, PersistentShellSession, compile_glob
+
+
+class WorkingDirectoryValidationTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.tool = BashCommandTool({'working_directory': self.directory.name})
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_verdict_is_reused_for_the_same_directory(self):
+        self.assertTrue(self.tool.validate_working_directory())
+        with mock.patch.object(bash_tool.os.path, 'isdir', side_effect=AssertionError('rechecked')):
+            self.assertTrue(self.tool.validate_working_directory())
+
+    def test_reassigned_directory_is_rechecked(self):
+        self.assertTrue(self.tool.validate_working_directory())
+        self.tool.working_directory = os.path.join(self.directory.name, 'missing')
+        self.assertFalse(self.tool.validate_working_directory())
+
+    def test_verdict_expires(self):
+        self.assertTrue(self.tool.validate_working_directory())
+        self.directory.cleanup()
+        self.assertTrue(self.tool.validate_working_directory())
+        later = bash_tool.time.monotonic() + bash_tool.WORKING_DIRECTORY_RECHECK_SECONDS
+        with mock.patch.object(bash_tool.time, 'monotonic', return_value=later):
+            self.assertFalse(self.tool.validate_working_directory())
+
+
+class PersistentShellSessionTest(unittest.TestCase):
+    def test_exited_shell_is_reaped_before_restart(self):
+        session = PersistentShellSession(tempfile.gettempdir())
+        self.addCleanup(session.close)
+        self.assertEqual(session.run('echo one', 10)[1], 'one\n')
+
+        dead = session._proc
+        dead.stdin.close()
+        dead.wait()
+        self.assertEqual(session.run('echo two', 10)[1], 'two\n')
+
+        self.assertIsNot(session._proc, dead)
+        self.assertTrue(dead.stdout.closed)
+        self.assertTrue(dead.stderr.closed)
+
+
+class SpoolOutputTest(unittest.TestCase):
+    def run_spooled(self, command, limit):
+        tool = BashCommandTool({'large_output_mode': 'spool', 'spool_output_limit_bytes': str(limit)})
+        return tool.execute(command)
+
+    def test_small_output_is_read_whole(self):
+        result = self.run_spooled('printf abcdef', 100)
+        self.assertEqual(result['output'], 'abcdef')
+        self.assertEqual(result['output_bytes_dropped'], 0)
+
+    def test_large_output_keeps_head_and_tail(self):
+        result = self.run_spooled("printf '%s' " + 'a' * 50 + 'b' * 1000 + 'c' * 50, 100)
+        self.assertTrue(result['success'])
+        self.assertEqual(result['output_bytes_dropped'], 1000)
+        self.assertTrue(result['output'].startswith('a' * 50 + '\n'))
+        self.assertTrue(result['output'].endswith('\n' + 'c' * 50))
+        self.assertIn('1000 bytes omitted', result['output'])
+
+
+class CompileGlobTest(unittest.TestCase):
+    def assert_matches(self, pattern, path, expected=True):
+        self.assertEqual(bool(compile_glob(pattern).match(path)), expected, f"{pattern} vs {path}")
+
+    def test_single_star_stays_within_a_directory(self):
+        self.assert_matches('*.md', 'README.md')
+        self.assert_matches('*.md', 'docs/guide.md', False)
+        self.assert_matches('src/*.py', 'src/main.py')
+        self.assert_matches('src/*.py', 'src/core/engine.py', False)
+        self.assert_matches('a?.py', 'a/.py', False)
+
+    def test_double_star_matches_any_depth(self):
+        self.assert_matches('**/*.py', 'main.py')
+        self.assert_matches('**/*.py', 'src/core/engine.py')
+        self.assert_matches('**/*.{py,md}', 'docs/guide.md')
+        self.assert_matches('src/**', 'src/core/engine.py')
+
+
+class FindFilesTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        for relative_path in ('a.py', 'b.py', 'src/c.py', 'node_modules/pkg/d.py', '.venv/lib/e.py', 'build/f.py'):
+            path = os.path.join(self.directory.name, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write('pass\n')
+        self.tool = FileSystemTool({})
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def found(self, result):
+        return [os.path.relpath(file_info['path'], self.directory.name) for file_info in result['files']]
+
+    def test_dependency_and_build_directories_are_skipped(self):
+        result = self.tool.find_files(self.directory.name, '**/*.py')
+        self.assertEqual(self.found(result), ['a.py', 'b.py', os.path.join('src', 'c.py')])
+        self.assertFalse(result['truncated'])
+
+    def test_walk_stops_at_max_files(self):
+        with mock.patch.object(bash_tool.os, 'scandir', wraps=os.scandir) as scandir:
+            result = self.tool.find_files(self.directory.name, '**/*.py', max_files=2)
+        self.assertEqual(self.found(result), ['a.py', 'b.py'])
+        self.assertTrue(result['truncated'])
+        self.assertEqual(scandir.call_count, 1)
+
+    def test_unreadable_subdirectory_is_skipped(self):
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.path.basename(path) == 'src':
+                raise PermissionError(path)
+            return real_scandir(path)
+
+        with mock.patch.object(bash_tool.os, 'scandir', scandir):
+            result = self.tool.find_files(self.directory.name, '**/*.py')
+        self.assertTrue(result['success'])
+        self.assertEqual(self.found(result), ['a.py', 'b.py'])
+
+    def test_single_star_does_not_descend(self):
+        result = self.tool.find_files(self.directory.name, '*.py')
+        self.assertEqual(self.found(result), ['a.py', 'b.py'])
+
+
+if __name__ == '__main__':
+    unittest.main()
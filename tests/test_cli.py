@@ -0,0 +1,93 @@
+"""Tests for git data collection when git commands fail."""
+
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from uv_aix_agent import cli
+
+
+class FailedCollectionTest(unittest.TestCase):
+    def setUp(self):
+        # Run from a directory outside any repository so every git query fails
+        self.original_cwd = os.getcwd()
+        self.directory = tempfile.TemporaryDirectory()
+        os.chdir(self.directory.name)
+        self.env = mock.patch.dict(os.environ, {'GIT_CEILING_DIRECTORIES': os.path.dirname(self.directory.name)})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        os.chdir(self.original_cwd)
+        self.directory.cleanup()
+
+    def test_failed_queries_leave_metrics_unknown(self):
+        collection = cli.collect_git_data()
+        raw_data = collection['raw_data']
+
+        self.assertIsNone(raw_data['total_commits'])
+        self.assertIsNone(raw_data['total_authors'])
+        self.assertTrue(collection['errors'])
+
+        metrics = cli.calculate_metrics(raw_data)
+        warning_ids = [
+            warning['id'] for warning in cli.generate_warnings(
+                raw_data, metrics['lifetime_metrics'], metrics['recent_metrics'], collection['errors']
+            )
+        ]
+        self.assertIn('bash_tool_unavailable', warning_ids)
+        self.assertIn('incomplete_metrics', warning_ids)
+        self.assertNotIn('low_commit_activity', warning_ids)
+
+    def test_unrunnable_git_leaves_every_metric_unknown(self):
+        async def fail_all(commands, on_complete=None, text=True, budget=None):
+            return [
+                {'name': name, 'command': command, 'success': False, 'output': b'',
+                 'error': 'Command timed out after 60 seconds', 'returncode': -1}
+                for name, command in commands
+            ]
+
+        with mock.patch.object(cli, 'run_commands_concurrently', fail_all):
+            collection = cli.collect_git_data()
+
+        self.assertTrue(all(value is None for value in collection['raw_data'].values()))
+        self.assertEqual(len(collection['errors']), len(cli.GIT_COMMANDS))
+        warning_ids = [
+            warning['id'] for warning in cli.generate_warnings(collection['raw_data'], {}, {}, collection['errors'])
+        ]
+        self.assertEqual(warning_ids, ['bash_tool_unavailable'])
+
+
+class EmptyRepositoryTest(unittest.TestCase):
+    def setUp(self):
+        self.original_cwd = os.getcwd()
+        self.directory = tempfile.TemporaryDirectory()
+        os.chdir(self.directory.name)
+        subprocess.run(['git', 'init', '-q'], check=True)
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        self.directory.cleanup()
+
+    def test_unborn_head_is_an_empty_history(self):
+        collection = cli.collect_git_data()
+        raw_data = collection['raw_data']
+
+        self.assertEqual(collection['errors'], [])
+        self.assertEqual(raw_data['total_commits'], 0)
+        self.assertEqual(raw_data['commits_7d'], 0)
+        self.assertEqual(raw_data['files_changed_7d'], 0)
+
+        metrics = cli.calculate_metrics(raw_data)
+        warning_ids = [
+            warning['id'] for warning in cli.generate_warnings(
+                raw_data, metrics['lifetime_metrics'], metrics['recent_metrics'], collection['errors']
+            )
+        ]
+        self.assertNotIn('bash_tool_unavailable', warning_ids)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Tests for the report engine's analysis runner and cache keys."""
+
+import asyncio
+import threading
+import unittest
+
+from uv_aix_agent.core.report_engine import XMLReportGenerator, _run_analysis
+
+
+def make_prompt_data(execution_time, output='abc', size=10):
+    return {
+        'bash_commands': {
+            'log': {'command': 'git log', 'output': output, 'success': True, 'execution_time': execution_time}
+        },
+        'file_analysis': {
+            'analyzed_files': [{'path': 'README.md', 'size': size, 'content_preview': '# Title'}]
+        },
+        'errors': []
+    }
+
+
+class CollectionFingerprintTest(unittest.TestCase):
+    def test_timings_and_sizes_do_not_change_the_fingerprint(self):
+        self.assertEqual(
+            XMLReportGenerator._collection_fingerprint(make_prompt_data(0.1, size=10)),
+            XMLReportGenerator._collection_fingerprint(make_prompt_data(0.2, size=20))
+        )
+
+    def test_changed_output_changes_the_fingerprint(self):
+        self.assertNotEqual(
+            XMLReportGenerator._collection_fingerprint(make_prompt_data(0.1)),
+            XMLReportGenerator._collection_fingerprint(make_prompt_data(0.1, output='abd'))
+        )
+
+
+async def current_loop():
+    await asyncio.sleep(0)
+    return asyncio.get_running_loop()
+
+
+class RunAnalysisTest(unittest.TestCase):
+    def test_runs_from_inside_an_event_loop(self):
+        async def caller():
+            return _run_analysis(current_loop())
+
+        self.assertIs(asyncio.run(caller()), _run_analysis(current_loop()))
+
+    def test_threads_share_one_loop(self):
+        loops = []
+        threads = [threading.Thread(target=lambda: loops.append(_run_analysis(current_loop()))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(loops), 4)
+        self.assertEqual(len(set(map(id, loops))), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,29 +1,75 @@
 """Base action class for UV AI Agent workflows."""
 
+import asyncio
+import os
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from concurrent.futures import ThreadPoolExecutor
 
 
-@dataclass
+# Well-known keys that live in dedicated ActionContext slots instead of `data`
+CONTEXT_SLOT_KEYS = frozenset({'raw_data', 'metrics', 'warnings', 'errors', 'final_report'})
+
+
+@dataclass(slots=True)
 class ActionContext:
-    """Context passed between actions in a workflow."""
+    """Context passed between actions in a workflow.
+    
+    Keys listed in CONTEXT_SLOT_KEYS are stored as typed slot attributes;
+    any other key goes into the free-form ``data`` dict. get/set/update
+    route transparently, and a slot left at None reads as missing.
+    """
     data: Dict[str, Any]
     config: Dict[str, Any]
     tools: Dict[str, Any]
     metadata: Dict[str, Any]
+    raw_data: Optional[Dict[str, Any]] = None
+    metrics: Optional[Dict[str, Any]] = None
+    warnings: Optional[List[Dict[str, Any]]] = None
+    errors: Optional[List[str]] = None
+    final_report: Optional[str] = None
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get value from context data."""
+        if key in CONTEXT_SLOT_KEYS:
+            value = getattr(self, key)
+            return default if value is None else value
         return self.data.get(key, default)
     
     def set(self, key: str, value: Any) -> None:
         """Set value in context data."""
-        self.data[key] = value
+        if key in CONTEXT_SLOT_KEYS:
+            setattr(self, key, value)
+        else:
+            self.data[key] = value
     
     def update(self, data: Dict[str, Any]) -> None:
         """Update context data with new values."""
-        self.data.update(data)
+        for key, value in data.items():
+            self.set(key, value)
+    
+    def copy(self) -> 'ActionContext':
+        """Return a context with its own data dict; config and tools are shared."""
+        return replace(self, data=dict(self.data), metadata=dict(self.metadata))
+    
+    def merge(self, other: 'ActionContext', base: Optional['ActionContext'] = None) -> None:
+        """Fold the results of another context (e.g. a parallel branch) into this one.
+        
+        With base, the snapshot the branch was forked from, only values the branch
+        actually replaced are applied, so a sibling's untouched inherited copy never
+        overwrites what another branch wrote.
+        """
+        for key in CONTEXT_SLOT_KEYS:
+            value = getattr(other, key)
+            if value is not None and (base is None or value is not getattr(base, key)):
+                setattr(self, key, value)
+        if base is None:
+            self.data.update(other.data)
+            return
+        for key, value in other.data.items():
+            if key not in base.data or value is not base.data[key]:
+                self.data[key] = value
 
 
 class BaseAction(ABC):
@@ -33,6 +79,7 @@ class BaseAction(ABC):
         self.name = name
         self.description = description
         self._logger = None
+        self._required_tools_cache: Optional[frozenset] = None
     
     @abstractmethod
     def execute(self, context: ActionContext) -> ActionContext:
@@ -50,6 +97,21 @@ class BaseAction(ABC):
         """
         pass
     
+    async def aexecute(self, context: ActionContext) -> ActionContext:
+        """
+        Execute the action from a coroutine.
+        
+        The default implementation runs the synchronous execute() in a worker
+        thread; I/O-bound actions with a native coroutine path should override it.
+        
+        Args:
+            context: ActionContext containing data, config, tools, and metadata
+            
+        Returns:
+            Updated ActionContext with results
+        """
+        return await asyncio.to_thread(self.execute, context)
+    
     def validate_inputs(self, context: ActionContext) -> bool:
         """
         Validate that the context contains required inputs.
@@ -71,6 +133,13 @@ class BaseAction(ABC):
         """
         return []
     
+    @property
+    def required_tools_set(self) -> frozenset:
+        """Required tool names, computed once from get_required_tools()."""
+        if self._required_tools_cache is None:
+            self._required_tools_cache = frozenset(self.get_required_tools())
+        return self._required_tools_cache
+    
     def can_execute(self, context: ActionContext) -> bool:
         """
         Check if this action can execute with the given context.
@@ -82,10 +151,9 @@ class BaseAction(ABC):
             True if action can execute, False otherwise
         """
         # Check if required tools are available
-        required_tools = self.get_required_tools()
-        for tool_name in required_tools:
-            if tool_name not in context.tools:
-                return False
+        required_tools = self.required_tools_set
+        if required_tools and not required_tools <= context.tools.keys():
+            return False
         
         # Validate inputs
         return self.validate_inputs(context)
@@ -122,6 +190,12 @@ class ConditionalAction(BaseAction):
             # Condition not met, return context unchanged
             return context
     
+    async def aexecute(self, context: ActionContext) -> ActionContext:
+        """Await the wrapped action if condition is met."""
+        if self.condition_func(context):
+            return await self.action.aexecute(context)
+        return context
+    
     def validate_inputs(self, context: ActionContext) -> bool:
         """Validate inputs for the wrapped action."""
         return self.action.validate_inputs(context)
@@ -132,19 +206,44 @@ class ConditionalAction(BaseAction):
 
 
 class ParallelAction(BaseAction):
-    """Action that executes multiple actions in parallel."""
+    """Action that executes multiple actions in parallel.
     
-    def __init__(self, name: str, actions: List[BaseAction], description: str = ""):
+    Child actions run on a thread pool, each against its own copy of the
+    context, so they must be thread-safe with respect to shared tools. Actions
+    mostly wait on subprocesses, which release the GIL, so by default the pool
+    is sized well past the CPU count.
+    """
+    
+    def __init__(self, name: str, actions: List[BaseAction], description: str = "",
+                 max_workers: Optional[int] = None):
         super().__init__(name, description)
         self.actions = actions
+        self.max_workers = max_workers
     
     def execute(self, context: ActionContext) -> ActionContext:
         """Execute all actions in parallel and merge results."""
-        # For now, execute sequentially (parallel execution would require threading/async)
-        # This is a placeholder for future parallel implementation
-        for action in self.actions:
-            if action.can_execute(context):
-                context = action.execute(context)
+        runnable = [action for action in self.actions if action.can_execute(context)]
+        if not runnable:
+            return context
+        
+        max_workers = self.max_workers or min(len(runnable), (os.cpu_count() or 1) * 4)
+        base = context.copy()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(action.execute, context.copy()) for action in runnable]
+            # Merge only what each action changed, in declaration order so later
+            # actions win when two of them write the same key
+            for future in futures:
+                context.merge(future.result(), base)
+        
+        return context
+    
+    async def aexecute(self, context: ActionContext) -> ActionContext:
+        """Await all actions concurrently and merge results."""
+        runnable = [action for action in self.actions if action.can_execute(context)]
+        base = context.copy()
+        results = await asyncio.gather(*(action.aexecute(context.copy()) for action in runnable))
+        for result in results:
+            context.merge(result, base)
         return context
     
     def validate_inputs(self, context: ActionContext) -> bool:
@@ -152,8 +251,8 @@ class ParallelAction(BaseAction):
         return all(action.validate_inputs(context) for action in self.actions)
     
     def get_required_tools(self) -> List[str]:
-        """Get required tools from all actions."""
-        tools = set()
+        """Get required tools from all actions, de-duplicated in first-seen order."""
+        required_tools = {}
         for action in self.actions:
-            tools.update(action.get_required_tools())
-        return list(tools)
\ No newline at end of file
+            required_tools.update(dict.fromkeys(action.get_required_tools()))
+        return list(required_tools)
\ No newline at end of file
@@ -3,16 +3,17 @@
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.syntax import Syntax
 from pathlib import Path
+import asyncio
 import json
-import subprocess
+import time
 from datetime import datetime
-from typing import Optional, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Optional, List
 import os
+import shutil
+import xml.etree.ElementTree as ET
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -26,70 +27,121 @@ app = typer.Typer(
 )
 console = Console()
 
-def get_available_reports() -> List[tuple]:
-    """Get list of available XML report definitions."""
+# Report definitions live next to this script, in an organized structure
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPORTS_DIRS = (
+    SCRIPT_DIR / "reports/git_analysis",
+    SCRIPT_DIR / "reports/code_quality",
+    SCRIPT_DIR / "reports",
+)
+
+# Report name/description cache so repeated `list` runs only stat the definitions
+REPORTS_CACHE_FILE = Path.home() / '.cache' / 'uv-aix-agent' / 'reports.json'
+
+def _read_report_metadata(xml_file: Path) -> tuple:
+    """Read name and description from a report definition, stopping at </metadata>."""
+    with open(xml_file, 'rb') as f:
+        for _, elem in ET.iterparse(f, events=('end',)):
+            if elem.tag == 'metadata':
+                name = elem.findtext('name') or xml_file.stem
+                description = elem.findtext('description') or "No description available"
+                return (str(xml_file), name, description)
+    raise ValueError(f"No metadata section in {xml_file}")
+
+def _load_reports_cache() -> dict:
+    """Load the on-disk report metadata cache, keyed by absolute report path."""
+    try:
+        with open(REPORTS_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_reports_cache(cache: dict) -> None:
+    """Persist the report metadata cache; failures only cost a re-parse next time."""
+    try:
+        REPORTS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(REPORTS_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+@lru_cache(maxsize=4)
+def _scan_reports(dirs_with_mtime: tuple) -> tuple:
+    """Parse report metadata from the given directories; cached per directory mtimes."""
     reports = []
+    cache = _load_reports_cache()
+    cache_changed = False
+    
+    for reports_dir, _ in dirs_with_mtime:
+        for xml_file in Path(reports_dir).glob("*.xml"):
+            if xml_file.name != "base_template.xml":  # Skip template
+                # Reuse cached metadata while the file's mtime is unchanged
+                key = str(xml_file.resolve())
+                mtime = xml_file.stat().st_mtime_ns
+                cached = cache.get(key)
+                if cached and cached[0] == mtime:
+                    reports.append((str(xml_file), cached[1], cached[2]))
+                    continue
+                
+                try:
+                    report = _read_report_metadata(xml_file)
+                except Exception:
+                    # Fallback for malformed XML
+                    report = (str(xml_file), xml_file.stem, "XML parsing error")
+                reports.append(report)
+                cache[key] = [mtime, report[1], report[2]]
+                cache_changed = True
+    
+    if cache_changed:
+        _save_reports_cache(cache)
+    
+    return tuple(reports)
+
+def get_available_reports() -> tuple:
+    """Get list of available XML report definitions."""
+    # Adding or removing a report bumps its directory's mtime and invalidates the cache
+    cache_key = []
+    for reports_dir in REPORTS_DIRS:
+        try:
+            cache_key.append((str(reports_dir), reports_dir.stat().st_mtime_ns))
+        except OSError:
+            continue
+    return _scan_reports(tuple(cache_key))
+
+async def execute_bash_command_async(name: str, command: List[str], timeout: int = 60, text: bool = True) -> dict:
+    """Execute an argv command asynchronously, without a shell, and return results.
     
-    # Get the script directory to locate reports relative to the CLI script
-    script_dir = Path(__file__).parent
-    
-    # Check organized structure relative to script location
-    reports_dirs = [
-        script_dir / "reports/git_analysis",
-        script_dir / "reports/code_quality", 
-        script_dir / "reports"
-    ]
-    
-    for reports_dir in reports_dirs:
-        if reports_dir.exists():
-            for xml_file in reports_dir.glob("*.xml"):
-                if xml_file.name != "base_template.xml":  # Skip template
-                    # Parse basic metadata
-                    try:
-                        import xml.etree.ElementTree as ET
-                        tree = ET.parse(xml_file)
-                        root = tree.getroot()
-                        metadata = root.find('metadata')
-                        
-                        name_elem = metadata.find('name')
-                        name = name_elem.text if name_elem is not None else xml_file.stem
-                        
-                        desc_elem = metadata.find('description')
-                        description = desc_elem.text if desc_elem is not None else "No description available"
-                        
-                        reports.append((str(xml_file), name, description))
-                    except Exception:
-                        # Fallback for malformed XML
-                        reports.append((str(xml_file), xml_file.stem, "XML parsing error"))
-    
-    return reports
-
-def execute_bash_command(name: str, command: str, timeout: int = 60) -> dict:
-    """Execute a bash command and return results."""
+    With text=False the output is left as stripped bytes so callers that only
+    count lines or parse ASCII digits can skip the decode.
+    """
     try:
-        result = subprocess.run(
-            command, 
-            shell=True, 
-            capture_output=True, 
-            text=True, 
-            timeout=timeout
+        process = await asyncio.create_subprocess_exec(
+            *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
         )
+        
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return {
+                'name': name,
+                'command': command,
+                'success': False,
+                'output': '',
+                'error': f'Command timed out after {round(timeout, 1):g} seconds',
+                'returncode': -1
+            }
+        
+        error = stderr.decode(errors='replace').strip()
+        output = stdout.strip()
         return {
             'name': name,
             'command': command,
-            'success': result.returncode == 0,
-            'output': result.stdout.strip(),
-            'error': result.stderr.strip() if result.stderr else None,
-            'returncode': result.returncode
-        }
-    except subprocess.TimeoutExpired:
-        return {
-            'name': name,
-            'command': command,
-            'success': False,
-            'output': '',
-            'error': f'Command timed out after {timeout} seconds',
-            'returncode': -1
+            'success': process.returncode == 0,
+            'output': output.decode(errors='replace') if text else output,
+            'error': error or None,
+            'returncode': process.returncode
         }
     except Exception as e:
         return {
@@ -101,31 +153,152 @@ def execute_bash_command(name: str, command: str, timeout: int = 60) -> dict:
             'returncode': -1
         }
 
-def collect_git_data() -> dict:
-    """Collect Git data using comprehensive commands."""
-    
-    bash_commands = [
-        ("repo_name", "git config --get remote.origin.url | sed 's/.*\\///' | sed 's/\\.git$//' || echo 'unknown'"),
-        ("current_branch", "git rev-parse --abbrev-ref HEAD || echo 'unknown'"),
-        ("remote_url", "git config --get remote.origin.url || echo 'unknown'"),
-        ("first_commit_date", "git log --reverse --format=%ad --date=format:%Y-%m-%d --max-count=1 || echo 'unknown'"),
-        ("latest_commit_date", "git log -1 --format=%ad --date=format:%Y-%m-%d || echo 'unknown'"),
-        ("total_commits", "git rev-list --count HEAD || echo '0'"),
-        ("total_authors", "git shortlog -sn --all | wc -l || echo '0'"),
-        ("local_branches", "git branch | wc -l || echo '0'"),
-        ("remote_branches", "git branch -r | wc -l || echo '0'"),
-        ("total_tags", "git tag | wc -l || echo '0'"),
-        ("last_tag", "git describe --tags --abbrev=0 2>/dev/null || echo 'unknown'"),
-        ("merge_commits", "git log --merges --oneline | wc -l || echo '0'"),
-        ("commits_7d", "git rev-list --count --since='7 days ago' HEAD || echo '0'"),
-        ("authors_7d", "git shortlog -sn --since='7 days ago' | wc -l || echo '0'"),
-        ("files_changed_7d", "git log --since='7 days ago' --name-only --pretty=format: | sort -u | wc -l || echo '0'"),
-        ("working_tree_status", "git status --porcelain | wc -l")
-    ]
+def execute_bash_command(name: str, command: List[str], timeout: int = 60, text: bool = True) -> dict:
+    """Execute a command and return results."""
+    return asyncio.run(execute_bash_command_async(name, command, timeout, text))
+
+async def run_commands_concurrently(commands: List[tuple], on_complete: Optional[Callable[[dict], None]] = None,
+                                    text: bool = True, budget: Optional[float] = None) -> List[dict]:
+    """Run independent (name, command) pairs concurrently, returning results in input order.
+    
+    With a budget, all commands share one wall-clock deadline: each gets the time
+    remaining when it starts, and commands still queued once it has passed are skipped.
+    """
+    semaphore = asyncio.Semaphore(os.cpu_count() or 4)
+    deadline = time.monotonic() + budget if budget is not None else None
+    
+    async def run(name, command):
+        async with semaphore:
+            remaining = deadline - time.monotonic() if deadline is not None else 60
+            if remaining > 0:
+                result = await execute_bash_command_async(name, command, min(60, max(0.5, remaining)), text=text)
+            else:
+                result = {
+                    'name': name,
+                    'command': command,
+                    'success': False,
+                    'output': '',
+                    'error': 'Skipped: collection time budget exhausted',
+                    'returncode': -1
+                }
+        if on_complete:
+            on_complete(result)
+        return result
+    
+    return await asyncio.gather(*(run(name, command) for name, command in commands))
+
+# Resolve git once so each spawned command skips the PATH search
+GIT = shutil.which('git') or 'git'
+
+# Separator between the fields of a single commit record in git log output
+FIELD_SEP = b'\x1f'
+RECENT_WINDOW_SECONDS = 7 * 24 * 60 * 60
+# Wall-clock budget shared by all git queries of one collection run
+GIT_COLLECTION_BUDGET_SECONDS = 60
+
+def parse_history(output: bytes) -> dict:
+    """Derive commit, merge, date and recent-activity metrics from one HEAD walk."""
+    cutoff = time.time() - RECENT_WINDOW_SECONDS
+    total_commits = merge_commits = commits_7d = 0
+    authors_7d = set()
+    latest_date = first_date = None
+    
+    # git log lists newest first, so the last record is the root commit
+    for line in output.splitlines():
+        parents, author, date, timestamp = line.split(FIELD_SEP)
+        total_commits += 1
+        if b' ' in parents:
+            merge_commits += 1
+        if latest_date is None:
+            latest_date = date
+        first_date = date
+        if int(timestamp) >= cutoff:
+            commits_7d += 1
+            authors_7d.add(author)
     
-    results = {}
-    raw_data = {}
-    errors = []
+    return {
+        'first_commit_date': first_date.decode() if first_date else 'unknown',
+        'latest_commit_date': latest_date.decode() if latest_date else 'unknown',
+        'total_commits': total_commits,
+        'merge_commits': merge_commits,
+        'commits_7d': commits_7d,
+        'authors_7d': len(authors_7d),
+    }
+
+def parse_authors(output: bytes) -> dict:
+    """Count distinct authors across all refs."""
+    return {'total_authors': len(set(output.splitlines()))}
+
+def parse_refs(output: bytes) -> dict:
+    """Count local branches, remote branches and tags from one ref listing."""
+    refs = output.splitlines()
+    return {
+        'local_branches': sum(1 for ref in refs if ref.startswith(b'refs/heads/')),
+        'remote_branches': sum(1 for ref in refs if ref.startswith(b'refs/remotes/')),
+        'total_tags': sum(1 for ref in refs if ref.startswith(b'refs/tags/')),
+    }
+
+def parse_recent_files(output: bytes) -> dict:
+    """Count distinct files touched in the recent window."""
+    return {'files_changed_7d': len({line for line in output.splitlines() if line})}
+
+def count_lines(output: bytes) -> int:
+    """Count lines in stripped command output without splitting it."""
+    return output.count(b'\n') + 1 if output else 0
+
+def parse_working_tree(output: bytes) -> dict:
+    """Count entries reported by git status."""
+    return {'working_tree_status': count_lines(output)}
+
+# Batched git queries: each walks history or refs once and yields several metrics.
+# Their parsers work on raw bytes; int() accepts ASCII digits in bytes directly.
+# --ignore-missing makes a HEAD walk in a repository without commits yet (an unborn
+# HEAD) an empty history instead of a failure.
+GIT_QUERIES = (
+    ("history", [GIT, "log", "--format=%P%x1f%aN%x1f%ad%x1f%ct", "--date=format:%Y-%m-%d", "--ignore-missing", "HEAD"], parse_history),
+    ("all_authors", [GIT, "log", "--all", "--format=%aN"], parse_authors),
+    ("refs", [GIT, "for-each-ref", "--format=%(refname)"], parse_refs),
+    ("recent_files", [GIT, "log", "--since=7 days ago", "--name-only", "--format=", "--ignore-missing", "HEAD"], parse_recent_files),
+    ("working_tree", [GIT, "status", "--porcelain"], parse_working_tree),
+)
+
+def parse_current_branch(output: str) -> dict:
+    """Read the checked-out branch name."""
+    return {'current_branch': output or 'unknown'}
+
+def parse_remote(output: str) -> dict:
+    """Read the origin URL and derive the repository name from its last path segment."""
+    repo_name = output.rsplit('/', 1)[-1].removesuffix('.git')
+    return {
+        'repo_name': repo_name or 'unknown',
+        'remote_url': output or 'unknown',
+    }
+
+def parse_last_tag(output: str) -> dict:
+    """Read the most recent tag reachable from HEAD."""
+    return {'last_tag': output or 'unknown'}
+
+# Single-value lookups; a non-zero exit (no remote, no tags) simply means 'unknown'
+GIT_LOOKUPS = (
+    ("current_branch", [GIT, "rev-parse", "--abbrev-ref", "HEAD"], parse_current_branch),
+    ("remote_url", [GIT, "config", "--get", "remote.origin.url"], parse_remote),
+    ("last_tag", [GIT, "describe", "--tags", "--abbrev=0"], parse_last_tag),
+)
+
+# (name, argv) pairs for every git process of a collection run, in result order
+GIT_COMMANDS = tuple((name, command) for name, command, _ in GIT_QUERIES + GIT_LOOKUPS)
+
+# Order of the fields in the repository_data section of the report
+RAW_DATA_KEYS = [
+    'repo_name', 'current_branch', 'remote_url', 'first_commit_date', 'latest_commit_date',
+    'total_commits', 'total_authors', 'local_branches', 'remote_branches', 'total_tags',
+    'last_tag', 'merge_commits', 'commits_7d', 'authors_7d', 'files_changed_7d',
+    'working_tree_status'
+]
+
+def collect_git_data() -> dict:
+    """Collect Git data by running a handful of batched git queries concurrently."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     
     with Progress(
         SpinnerColumn(),
@@ -133,27 +306,41 @@ def collect_git_data() -> dict:
         console=console,
         transient=True
     ) as progress:
-        task = progress.add_task("Collecting Git repository data...", total=len(bash_commands))
+        task = progress.add_task("Collecting Git repository data...", total=len(GIT_COMMANDS))
         
-        for name, command in bash_commands:
-            progress.update(task, description=f"Executing: {name}")
-            result = execute_bash_command(name, command)
-            results[name] = result
-            
-            if result['success']:
-                output = result['output'].strip()
-                # Parse specific data types
-                if name in ['total_commits', 'total_authors', 'local_branches', 'remote_branches', 
-                           'total_tags', 'merge_commits', 'commits_7d', 'authors_7d', 
-                           'files_changed_7d', 'working_tree_status']:
-                    raw_data[name] = int(output) if output.isdigit() else 0
-                else:
-                    raw_data[name] = output or 'unknown'
-            else:
-                raw_data[name] = None
-                errors.append(f"Command '{name}' failed: {result['error']}")
-            
+        def advance(result: dict) -> None:
+            progress.update(task, description=f"Finished: {result['name']}")
             progress.advance(task)
+        
+        command_results = asyncio.run(
+            run_commands_concurrently(GIT_COMMANDS, advance, text=False, budget=GIT_COLLECTION_BUDGET_SECONDS)
+        )
+    
+    results = {}
+    collected = {}
+    errors = []
+    
+    for (name, _, parser), result in zip(GIT_QUERIES, command_results):
+        results[name] = result
+        if result['success']:
+            collected.update(parser(result['output']))
+        else:
+            # A failed query leaves its metrics unknown (None) rather than passing for an empty repo
+            collected.update(dict.fromkeys(parser(b'')))
+            errors.append(f"Command '{name}' failed: {result['error']}")
+    
+    for (name, _, parser), result in zip(GIT_LOOKUPS, command_results[len(GIT_QUERIES):]):
+        results[name] = result
+        if result['success']:
+            collected.update(parser(result['output'].decode(errors='replace')))
+        elif result['returncode'] == -1:
+            # Only a command that could not run at all (or timed out) is a collection error
+            collected.update(dict.fromkeys(parser('')))
+            errors.append(f"Command '{name}' failed: {result['error']}")
+        else:
+            collected.update(parser(''))
+    
+    raw_data = {key: collected.get(key) for key in RAW_DATA_KEYS}
     
     return {
         'bash_results': results,
@@ -163,12 +350,13 @@ def collect_git_data() -> dict:
 
 def calculate_metrics(raw_data: dict) -> dict:
     """Calculate derived metrics."""
-    total_commits = raw_data.get('total_commits', 0)
-    total_authors = raw_data.get('total_authors', 0)
-    merge_commits = raw_data.get('merge_commits', 0)
-    commits_7d = raw_data.get('commits_7d', 0)
-    files_changed_7d = raw_data.get('files_changed_7d', 0)
-    authors_7d = raw_data.get('authors_7d', 0)
+    # Metrics whose query failed are None; derive from them as if they were zero
+    total_commits = raw_data.get('total_commits') or 0
+    total_authors = raw_data.get('total_authors') or 0
+    merge_commits = raw_data.get('merge_commits') or 0
+    commits_7d = raw_data.get('commits_7d') or 0
+    files_changed_7d = raw_data.get('files_changed_7d') or 0
+    authors_7d = raw_data.get('authors_7d') or 0
     
     lifetime_metrics = {
         'commits_per_author': round(total_commits / total_authors, 2) if total_authors > 0 else 0.0,
@@ -187,169 +375,161 @@ def calculate_metrics(raw_data: dict) -> dict:
         'recent_metrics': recent_metrics
     }
 
-def generate_warnings(raw_data: dict, lifetime_metrics: dict, recent_metrics: dict, errors: list) -> list:
-    """Generate contextual warnings based on analysis data."""
-    warnings = []
-    
-    # Data collection warnings
-    if errors or not raw_data:
-        warnings.append({
-            "id": "bash_tool_unavailable",
-            "severity": "high",
-            "title": "Limited bash tool availability affected data collection",
-            "description": "The bash executor tool was not available or failed to execute commands properly",
-            "actions": [
-                {"priority": "high", "description": "Ensure bash executor tool is properly configured"},
-                {"priority": "medium", "description": "Verify Git repository access and permissions"},
-                {"priority": "low", "description": "Consider implementing fallback data collection methods"}
-            ]
-        })
-    
+def _freeze_warning(warning: dict) -> MappingProxyType:
+    """Make a warning template read-only so the shared instance cannot be mutated."""
+    actions = tuple(MappingProxyType(action) for action in warning['actions'])
+    return MappingProxyType({**warning, 'actions': actions})
+
+# Warning rules evaluated in order: (predicate(raw_data, lifetime_metrics, recent_metrics, errors), warning)
+WARNING_RULES = (
+    # Data collection warnings; collect_git_data always fills every key, so an empty
+    # raw_data only comes from callers that skipped collection altogether
+    (lambda raw, lifetime, recent, errors: bool(errors) or not raw, _freeze_warning({
+        "id": "bash_tool_unavailable",
+        "severity": "high",
+        "title": "Limited bash tool availability affected data collection",
+        "description": "The bash executor tool was not available or failed to execute commands properly",
+        "actions": [
+            {"priority": "high", "description": "Ensure bash executor tool is properly configured"},
+            {"priority": "medium", "description": "Verify Git repository access and permissions"},
+            {"priority": "low", "description": "Consider implementing fallback data collection methods"}
+        ]
+    })),
     # Check for incomplete metrics
-    if any(value is None for value in raw_data.values()):
-        warnings.append({
-            "id": "incomplete_metrics",
-            "severity": "medium", 
-            "title": "Some metrics may be incomplete or unavailable",
-            "description": "Data collection was partially successful but some metrics could not be calculated",
-            "actions": [
-                {"priority": "high", "description": "Review failed Git commands and fix underlying issues"},
-                {"priority": "medium", "description": "Validate repository structure and Git configuration"},
-                {"priority": "low", "description": "Enable debug logging for data collection process"}
-            ]
-        })
-    
+    (lambda raw, lifetime, recent, errors: None in raw.values(), _freeze_warning({
+        "id": "incomplete_metrics",
+        "severity": "medium", 
+        "title": "Some metrics may be incomplete or unavailable",
+        "description": "Data collection was partially successful but some metrics could not be calculated",
+        "actions": [
+            {"priority": "high", "description": "Review failed Git commands and fix underlying issues"},
+            {"priority": "medium", "description": "Validate repository structure and Git configuration"},
+            {"priority": "low", "description": "Enable debug logging for data collection process"}
+        ]
+    })),
     # Repository health warnings
-    commits_7d = raw_data.get('commits_7d', 0)
-    if commits_7d <= 1:
-        warnings.append({
-            "id": "low_commit_activity",
-            "severity": "medium",
-            "title": "Low recent commit activity detected", 
-            "description": "Repository shows minimal commit activity in recent period",
-            "actions": [
-                {"priority": "medium", "description": "Review development workflow and encourage regular commits"},
-                {"priority": "low", "description": "Consider implementing automated commit reminders"}
-            ]
-        })
-    
+    (lambda raw, lifetime, recent, errors: raw.get('commits_7d') is not None and raw['commits_7d'] <= 1, _freeze_warning({
+        "id": "low_commit_activity",
+        "severity": "medium",
+        "title": "Low recent commit activity detected", 
+        "description": "Repository shows minimal commit activity in recent period",
+        "actions": [
+            {"priority": "medium", "description": "Review development workflow and encourage regular commits"},
+            {"priority": "low", "description": "Consider implementing automated commit reminders"}
+        ]
+    })),
     # Single contributor warning
-    total_authors = raw_data.get('total_authors', 0)
-    if total_authors == 1:
-        warnings.append({
-            "id": "single_contributor",
-            "severity": "high",
-            "title": "Repository has only one active contributor",
-            "description": "All recent commits are from a single author, indicating potential bus factor risk",
-            "actions": [
-                {"priority": "high", "description": "Encourage code reviews and pair programming"},
-                {"priority": "high", "description": "Document critical system knowledge"},
-                {"priority": "medium", "description": "Consider bringing additional team members onto the project"}
-            ]
-        })
-    
+    (lambda raw, lifetime, recent, errors: raw.get('total_authors', 0) == 1, _freeze_warning({
+        "id": "single_contributor",
+        "severity": "high",
+        "title": "Repository has only one active contributor",
+        "description": "All recent commits are from a single author, indicating potential bus factor risk",
+        "actions": [
+            {"priority": "high", "description": "Encourage code reviews and pair programming"},
+            {"priority": "high", "description": "Document critical system knowledge"},
+            {"priority": "medium", "description": "Consider bringing additional team members onto the project"}
+        ]
+    })),
     # High commits per author warning
-    commits_per_author = lifetime_metrics.get('commits_per_author', 0)
-    if commits_per_author > 100:
-        warnings.append({
-            "id": "high_commits_per_author",
-            "severity": "low",  
-            "title": "High commits per author ratio",
-            "description": "Average commits per author is unusually high, may indicate lack of contribution diversity",
-            "actions": [
-                {"priority": "medium", "description": "Review commit granularity and encourage atomic commits"},
-                {"priority": "low", "description": "Consider squashing related commits before merging"}
-            ]
-        })
-    
+    (lambda raw, lifetime, recent, errors: lifetime.get('commits_per_author', 0) > 100, _freeze_warning({
+        "id": "high_commits_per_author",
+        "severity": "low",  
+        "title": "High commits per author ratio",
+        "description": "Average commits per author is unusually high, may indicate lack of contribution diversity",
+        "actions": [
+            {"priority": "medium", "description": "Review commit granularity and encourage atomic commits"},
+            {"priority": "low", "description": "Consider squashing related commits before merging"}
+        ]
+    })),
     # Merge commit analysis
-    merge_commit_ratio = lifetime_metrics.get('merge_commit_ratio', 0)
-    if merge_commit_ratio == 0.0:
-        warnings.append({
-            "id": "no_merge_commits",
-            "severity": "low",
-            "title": "No merge commits detected",
-            "description": "Repository appears to use linear history, which may indicate lack of feature branch workflow",
-            "actions": [
-                {"priority": "low", "description": "Consider implementing feature branch workflow"},
-                {"priority": "low", "description": "Evaluate benefits of merge vs rebase strategies"}
-            ]
-        })
-    
+    (lambda raw, lifetime, recent, errors: lifetime.get('merge_commit_ratio', 0) == 0.0, _freeze_warning({
+        "id": "no_merge_commits",
+        "severity": "low",
+        "title": "No merge commits detected",
+        "description": "Repository appears to use linear history, which may indicate lack of feature branch workflow",
+        "actions": [
+            {"priority": "low", "description": "Consider implementing feature branch workflow"},
+            {"priority": "low", "description": "Evaluate benefits of merge vs rebase strategies"}
+        ]
+    })),
     # Change density warning
-    change_density = recent_metrics.get('change_density', 0)
-    if change_density > 10.0:
-        warnings.append({
-            "id": "high_change_density",
-            "severity": "medium",
-            "title": "High change density in recent commits",
-            "description": "Recent commits show unusually high file change density",
-            "actions": [
-                {"priority": "medium", "description": "Review large commits for potential refactoring opportunities"},
-                {"priority": "low", "description": "Consider breaking large changes into smaller, focused commits"}
-            ]
-        })
-    
-    return warnings
+    (lambda raw, lifetime, recent, errors: recent.get('change_density', 0) > 10.0, _freeze_warning({
+        "id": "high_change_density",
+        "severity": "medium",
+        "title": "High change density in recent commits",
+        "description": "Recent commits show unusually high file change density",
+        "actions": [
+            {"priority": "medium", "description": "Review large commits for potential refactoring opportunities"},
+            {"priority": "low", "description": "Consider breaking large changes into smaller, focused commits"}
+        ]
+    })),
+)
 
-def format_xml_report(raw_data: dict, metrics: dict, warnings: list, errors: list) -> str:
-    """Format results as XML report."""
-    
-    xml_parts = ['<?xml version="1.0" encoding="UTF-8"?>']
-    xml_parts.append('<git_comprehensive_report>')
+def generate_warnings(raw_data: dict, lifetime_metrics: dict, recent_metrics: dict, errors: list) -> list:
+    """Generate contextual warnings based on analysis data.
+    
+    The returned warnings are shared read-only templates; callers that need
+    to modify one should copy it with dict().
+    """
+    # Without any collected data the data-collection warning says it all; the
+    # remaining rules would only compare against missing values
+    if all(value is None for value in raw_data.values()):
+        return [WARNING_RULES[0][1]]
+    
+    return [
+        warning for predicate, warning in WARNING_RULES
+        if predicate(raw_data, lifetime_metrics, recent_metrics, errors)
+    ]
+
+def build_xml_report(raw_data: dict, metrics: dict, warnings: list, errors: list) -> ET.Element:
+    """Build the XML report tree; ElementTree takes care of escaping values."""
+    root = ET.Element('git_comprehensive_report')
     
     # Metadata
-    xml_parts.append('  <metadata>')
-    xml_parts.append('    <name>Git Comprehensive Report</name>')
-    xml_parts.append(f'    <generated_at>{datetime.now().isoformat()}</generated_at>')
-    xml_parts.append('    <version>1.0</version>')
-    xml_parts.append('  </metadata>')
-    
-    # Raw data
-    xml_parts.append('  <repository_data>')
-    for key, value in raw_data.items():
-        xml_parts.append(f'    <{key}>{value}</{key}>')
-    xml_parts.append('  </repository_data>')
-    
-    # Metrics
-    xml_parts.append('  <lifetime_metrics>')
-    for key, value in metrics['lifetime_metrics'].items():
-        xml_parts.append(f'    <{key}>{value}</{key}>')
-    xml_parts.append('  </lifetime_metrics>')
-    
-    xml_parts.append('  <recent_metrics>')
-    for key, value in metrics['recent_metrics'].items():
-        xml_parts.append(f'    <{key}>{value}</{key}>')
-    xml_parts.append('  </recent_metrics>')
+    metadata = ET.SubElement(root, 'metadata')
+    ET.SubElement(metadata, 'name').text = 'Git Comprehensive Report'
+    ET.SubElement(metadata, 'generated_at').text = datetime.now().isoformat()
+    ET.SubElement(metadata, 'version').text = '1.0'
+    
+    # Raw data and metrics
+    for section_name, values in (
+        ('repository_data', raw_data),
+        ('lifetime_metrics', metrics['lifetime_metrics']),
+        ('recent_metrics', metrics['recent_metrics'])
+    ):
+        section = ET.SubElement(root, section_name)
+        for key, value in values.items():
+            ET.SubElement(section, key).text = str(value)
     
     # Warnings and actions
-    xml_parts.append('  <warnings>')
+    warnings_element = ET.SubElement(root, 'warnings')
     for warning in warnings:
-        xml_parts.append('    <warning>')
-        xml_parts.append(f'      <id>{warning["id"]}</id>')
-        xml_parts.append(f'      <severity>{warning["severity"]}</severity>')
-        xml_parts.append(f'      <title>{warning["title"]}</title>')
-        xml_parts.append(f'      <description>{warning["description"]}</description>')
-        xml_parts.append('      <actions>')
+        warning_element = ET.SubElement(warnings_element, 'warning')
+        for key in ('id', 'severity', 'title', 'description'):
+            ET.SubElement(warning_element, key).text = warning[key]
+        actions_element = ET.SubElement(warning_element, 'actions')
         for action in warning["actions"]:
-            xml_parts.append('        <action>')
-            xml_parts.append(f'          <priority>{action["priority"]}</priority>')
-            xml_parts.append(f'          <description>{action["description"]}</description>')
-            xml_parts.append('        </action>')
-        xml_parts.append('      </actions>')
-        xml_parts.append('    </warning>')
-    xml_parts.append('  </warnings>')
+            action_element = ET.SubElement(actions_element, 'action')
+            ET.SubElement(action_element, 'priority').text = action["priority"]
+            ET.SubElement(action_element, 'description').text = action["description"]
     
     # Errors if any
     if errors:
-        xml_parts.append('  <errors>')
+        errors_element = ET.SubElement(root, 'errors')
         for error in errors:
-            xml_parts.append(f'    <error>{error}</error>')
-        xml_parts.append('  </errors>')
+            ET.SubElement(errors_element, 'error').text = error
     
-    xml_parts.append('</git_comprehensive_report>')
-    
-    return '\n'.join(xml_parts)
+    ET.indent(root, space='  ')
+    return root
+
+def write_xml_report(root: ET.Element, output_file: str) -> None:
+    """Serialize a report tree straight to a file."""
+    ET.ElementTree(root).write(output_file, encoding='utf-8', xml_declaration=True)
+
+def format_xml_report(raw_data: dict, metrics: dict, warnings: list, errors: list) -> str:
+    """Format results as XML report."""
+    root = build_xml_report(raw_data, metrics, warnings, errors)
+    return ET.tostring(root, encoding='unicode', xml_declaration=True)
 
 @app.command("list")
 def list_reports():
@@ -363,6 +543,8 @@ def list_reports():
         console.print("Make sure you have XML report files in the reports/ directory.")
         return
     
+    from rich.table import Table
+    
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Name", style="cyan", width=30)
     table.add_column("File", style="green", width=40) 
@@ -469,13 +651,11 @@ def run_report(
         
         # Step 4: Format XML report
         console.print("📝 [bold yellow]Step 4:[/bold yellow] Formatting XML report...")
-        xml_report = format_xml_report(raw_data, metrics, warnings, errors)
+        report_root = build_xml_report(raw_data, metrics, warnings, errors)
         
         # Step 5: Save and display results
         output_file = output or f"git_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xml"
-        
-        with open(output_file, 'w') as f:
-            f.write(xml_report)
+        write_xml_report(report_root, output_file)
         
         console.print(f"\n✅ [bold green]Report generated successfully![/bold green]")
         console.print(f"📁 [dim]Saved to:[/dim] {output_file}")
@@ -498,6 +678,9 @@ def run_report(
         # Display XML if requested
         if show_xml:
             console.print(f"\n📄 [bold blue]Generated XML Report:[/bold blue]")
+            from rich.syntax import Syntax
+            
+            xml_report = ET.tostring(report_root, encoding='unicode', xml_declaration=True)
             syntax = Syntax(xml_report, "xml", theme="monokai", line_numbers=True)
             console.print(syntax)
             
@@ -514,6 +697,7 @@ def run_report(
 @app.command("info")
 def show_info():
     """ℹ️  Show information about UV AI Agent."""
+    from rich.panel import Panel
     
     info_panel = Panel.fit(
         "[bold blue]🤖 UV AI Agent[/bold blue]\n\n"
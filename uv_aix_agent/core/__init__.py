@@ -3,10 +3,12 @@
 from .xml_parser import parse_report_definition, parse_global_tools
 from .tool_manager import ToolManager
 from .report_engine import XMLReportGenerator
+from .semantic_cache import SemanticCache
 
 __all__ = [
     'parse_report_definition',
     'parse_global_tools', 
     'ToolManager',
-    'XMLReportGenerator'
+    'XMLReportGenerator',
+    'SemanticCache'
 ]
\ No newline at end of file
@@ -1,19 +1,161 @@
 import os
 import json
-import xml.etree.ElementTree as ET
+import asyncio
+import atexit
+import hashlib
+import re
+import threading
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-from llama_index.core import Settings
-from llama_index.llms.openai import OpenAI
-from llama_index.embeddings.huggingface import HuggingFaceEmbedding
-from llama_index.core.agent import FunctionCallingAgentWorker, AgentRunner
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .xml_parser import ReportDefinition, parse_report_definition
 from .tool_manager import ToolManager
+from .semantic_cache import SemanticCache
+from ..utils.rate_limit import TokenBucketRateLimiter, estimate_tokens, retry_with_backoff
+
+# llama_index and openai pull in torch/transformers, which takes seconds; they are
+# imported where a report actually needs a model rather than at module import
+if TYPE_CHECKING:
+    import httpx
+    from llama_index.llms.openai import OpenAI
+    from llama_index.embeddings.huggingface import HuggingFaceEmbedding
+
+@lru_cache(maxsize=None)
+def _retryable_llm_errors() -> tuple:
+    """Transient OpenAI failures worth retrying instead of failing the task."""
+    from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+    return (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+# Control characters that XML 1.0 cannot represent; lxml rejects them outright
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+def _xml_text(value: Optional[str]) -> Optional[str]:
+    """Strip characters that cannot appear in XML from command or LLM output."""
+    return _INVALID_XML_CHARS.sub('', value) if value else value
+
+def _to_json(value: Any) -> str:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(value, indent=2, default=str)
+
+# The collected data comes first so every task in a run shares a byte-identical prompt
+# prefix (which the provider can serve from its prompt cache); task details follow it
+TASK_PROMPT_PREFIX = "System context and collected data:\n"
+TASK_PROMPT_SUFFIX = """
+---
+Task: {description}
+Priority: {priority}
+
+Please analyze the data above and provide structured results according to the task requirements.
+Focus on: {description}
+
+Tool sequence to follow:
+{tool_sequence}
+"""
+
+# Pooled async HTTP clients by connection limit; closed when the process exits
+_ASYNC_HTTP_CLIENTS: Dict[int, 'httpx.AsyncClient'] = {}
+
+def _get_async_http_client(max_connections: int) -> 'httpx.AsyncClient':
+    """Return the shared client, so analysis requests reuse kept-alive connections across reports."""
+    client = _ASYNC_HTTP_CLIENTS.get(max_connections)
+    if client is None:
+        import httpx
+        client = _ASYNC_HTTP_CLIENTS[max_connections] = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+    return client
+
+# An asyncio.Runner is not thread-safe, so reports generated from several threads take turns
+_ANALYSIS_RUNNER_LOCK = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _get_analysis_runner() -> asyncio.Runner:
+    """Event loop shared by the analysis phase of every report.
+    
+    Pooled connections belong to the loop that opened them, so a fresh asyncio.run()
+    per report could not reuse the shared client's connections.
+    """
+    runner = asyncio.Runner()
+    atexit.register(_close_analysis_runner, runner)
+    return runner
+
+def _close_analysis_runner(runner: asyncio.Runner) -> None:
+    with _ANALYSIS_RUNNER_LOCK:
+        while _ASYNC_HTTP_CLIENTS:
+            _, client = _ASYNC_HTTP_CLIENTS.popitem()
+            runner.run(client.aclose())
+        runner.close()
+
+def _run_analysis(coro) -> Any:
+    """Run the analysis phase to completion on the shared event loop, from synchronous code."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        with _ANALYSIS_RUNNER_LOCK:
+            return _get_analysis_runner().run(coro)
+    # The caller's thread already runs an event loop (e.g. an async application or
+    # Jupyter), which cannot be re-entered; block on a worker thread instead
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_run_analysis, coro).result()
+
+# Rate limiter of the analysis run the current task belongs to; the run's tasks inherit it
+_RATE_LIMITER: ContextVar[Optional[TokenBucketRateLimiter]] = ContextVar('rate_limiter', default=None)
+
+@lru_cache(maxsize=None)
+def _rate_limited_openai_class() -> type:
+    """OpenAI LLM that charges every chat request to the current run's rate limiter.
+    
+    An agent query makes one request per reasoning step, each resending the growing
+    chat, so the budgets are charged per request rather than once per task.
+    """
+    from llama_index.llms.openai import OpenAI
+    
+    class RateLimitedOpenAI(OpenAI):
+        async def achat(self, messages, **kwargs):
+            rate_limiter = _RATE_LIMITER.get()
+            if rate_limiter is not None:
+                await rate_limiter.acquire(estimate_tokens(''.join(str(message.content or '') for message in messages)))
+            return await super().achat(messages, **kwargs)
+    
+    return RateLimitedOpenAI
+
+# Model instances are shared by every report generated in the process; loading the
+# embedding model's weights in particular is far too slow to repeat per report
+@lru_cache(maxsize=None)
+def _get_openai_llm(model: str, api_key: str, temperature: float, max_connections: int = 4) -> 'OpenAI':
+    return _rate_limited_openai_class()(
+        model=model,
+        api_key=api_key,
+        temperature=temperature,
+        async_http_client=_get_async_http_client(max_connections)
+    )
+
+@lru_cache(maxsize=4)
+def _get_embedding_model(model_name: str) -> 'HuggingFaceEmbedding':
+    from llama_index.embeddings.huggingface import HuggingFaceEmbedding
+    return HuggingFaceEmbedding(model_name=model_name)
 
 class XMLReportGenerator:
     """Generates reports based on XML configuration."""
     
+    __slots__ = ('config', 'report_definition', 'tool_manager')
+    
     def __init__(self, report_xml_path: str, config: Dict[str, Any]):
         self.config = config
         self.report_definition = parse_report_definition(report_xml_path)
@@ -24,22 +166,23 @@ class XMLReportGenerator:
     
     def _setup_llm_and_embedding_model(self):
         """Setup LLM and embedding models."""
+        from llama_index.core import Settings
+        
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set.")
 
         if self.config["provider"] == "openai":
-            Settings.llm = OpenAI(
-                model=self.config["llm_model"],
-                api_key=api_key,
-                temperature=self.report_definition.agent_configuration.temperature
+            Settings.llm = _get_openai_llm(
+                self.config["llm_model"],
+                api_key,
+                self.report_definition.agent_configuration.temperature,
+                self.config.get('max_concurrent_tasks', 4)
             )
         else:
             raise ValueError(f"Provider '{self.config['provider']}' not supported in XML reports yet.")
 
-        Settings.embed_model = HuggingFaceEmbedding(
-            model_name=self.config["embedding_model"]
-        )
+        Settings.embed_model = _get_embedding_model(self.config["embedding_model"])
     
     def _load_tools(self):
         """Load and validate tools for this report."""
@@ -61,24 +204,32 @@ class XMLReportGenerator:
             'errors': []
         }
         
-        # Execute bash commands
-        for bash_cmd in self.report_definition.data_collection.bash_commands:
-            print(f"Executing bash command: {bash_cmd.name}")
-            
-            try:
-                result = self.tool_manager.execute_bash_command(
-                    bash_cmd.command, 
-                    {'timeout': bash_cmd.timeout}
-                )
-                collection_results['bash_commands'][bash_cmd.name] = result
+        # Execute bash commands; they are independent subprocesses, so run them on a thread pool
+        bash_commands = self.report_definition.data_collection.bash_commands
+        if bash_commands:
+            with ThreadPoolExecutor(max_workers=min(8, len(bash_commands))) as executor:
+                futures = []
+                for bash_cmd in bash_commands:
+                    print(f"Executing bash command: {bash_cmd.name}")
+                    futures.append(executor.submit(
+                        self.tool_manager.execute_bash_command,
+                        bash_cmd.command,
+                        {'timeout': bash_cmd.timeout}
+                    ))
                 
-                if not result['success']:
-                    collection_results['errors'].append(f"Bash command '{bash_cmd.name}' failed: {result['error']}")
-                    
-            except Exception as e:
-                error_msg = f"Error executing bash command '{bash_cmd.name}': {e}"
-                collection_results['errors'].append(error_msg)
-                print(f"Error: {error_msg}")
+                # Collect in definition order so the report layout is stable
+                for bash_cmd, future in zip(bash_commands, futures):
+                    try:
+                        result = future.result()
+                        collection_results['bash_commands'][bash_cmd.name] = result
+                        
+                        if not result['success']:
+                            collection_results['errors'].append(f"Bash command '{bash_cmd.name}' failed: {result['error']}")
+                            
+                    except Exception as e:
+                        error_msg = f"Error executing bash command '{bash_cmd.name}': {e}"
+                        collection_results['errors'].append(error_msg)
+                        print(f"Error: {error_msg}")
         
         # Execute file analysis
         file_analysis_config = self.report_definition.data_collection.file_analysis
@@ -86,21 +237,22 @@ class XMLReportGenerator:
             file_tool = self.tool_manager.get_tool('file_analyzer')
             if file_tool:
                 try:
-                    # List files matching pattern
-                    files_result = file_tool.list_files('.', file_analysis_config.get('pattern'))
+                    # Find files matching the glob pattern, stopping once there are enough to analyze
+                    max_files = file_analysis_config.get('max_files', 10)
+                    files_result = file_tool.find_files('.', file_analysis_config.get('pattern') or '*', max_files)
                     collection_results['file_analysis']['files_found'] = files_result
                     
                     # Analyze subset of files
-                    max_files = file_analysis_config.get('max_files', 10)
                     if files_result['success'] and files_result['files']:
                         analyzed_files = []
                         for file_info in files_result['files'][:max_files]:
-                            file_content = file_tool.read_file(file_info['path'])
+                            # Only the preview is needed, so don't read whole files
+                            file_content = file_tool.read_preview(file_info['path'], 500)
                             if file_content['success']:
                                 analyzed_files.append({
                                     'path': file_info['path'],
                                     'size': file_info['size_bytes'],
-                                    'content_preview': file_content['content'][:500] + '...' if len(file_content['content']) > 500 else file_content['content']
+                                    'content_preview': file_content['content'] + '...' if file_content['truncated'] else file_content['content']
                                 })
                         collection_results['file_analysis']['analyzed_files'] = analyzed_files
                 
@@ -111,130 +263,233 @@ class XMLReportGenerator:
         
         return collection_results
     
-    def _execute_analysis_tasks(self, collection_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute analysis tasks using the agent."""
+    def _prompt_collection_data(self, collection_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Trim collection data for the analysis prompts to keep input tokens down."""
+        max_output = self.config.get('max_prompt_output_chars', 4096)
+        bash_commands = {}
+        for name, result in collection_data['bash_commands'].items():
+            output = result.get('output') or ''
+            if len(output) > max_output:
+                result = {**result, 'output': output[:max_output] + "\n[OUTPUT TRUNCATED]"}
+            bash_commands[name] = result
+        
+        # File previews are only worth their tokens when some task works with the file analyzer
+        file_analysis = collection_data['file_analysis']
+        uses_files = any(
+            step.get('tool') == 'file_analyzer'
+            for task in self.report_definition.analysis_tasks
+            for step in task.tool_sequence
+        )
+        if not uses_files and file_analysis.get('analyzed_files'):
+            file_analysis = {
+                **file_analysis,
+                'analyzed_files': [
+                    {'path': file_info['path'], 'size': file_info['size']}
+                    for file_info in file_analysis['analyzed_files']
+                ]
+            }
+        
+        return {**collection_data, 'bash_commands': bash_commands, 'file_analysis': file_analysis}
+    
+    @staticmethod
+    def _collection_fingerprint(prompt_data: Dict[str, Any]) -> str:
+        """Hash the prompt data fields that stay the same between runs over an unchanged repository.
+        
+        Execution times and file sizes are left out, so a rerun hashes identically.
+        """
+        stable = {
+            'bash_commands': {
+                name: {key: result.get(key) for key in ('command', 'output', 'success')}
+                for name, result in prompt_data['bash_commands'].items()
+            },
+            'analyzed_files': [
+                {'path': file_info['path'], 'content_preview': file_info.get('content_preview')}
+                for file_info in prompt_data['file_analysis'].get('analyzed_files', [])
+            ]
+        }
+        return hashlib.sha256(_to_json(stable).encode()).hexdigest()
+    
+    async def _execute_analysis_tasks(self, collection_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute analysis tasks concurrently using the agent."""
+        from llama_index.core import Settings
+        from llama_index.core.agent import FunctionCallingAgentWorker, AgentRunner
+        
         analysis_results = {}
+        max_concurrent_tasks = self.config.get('max_concurrent_tasks', 4)
+        
+        # The cached LLM carries the shared pooled client, so requests reuse kept-alive
+        # connections across tasks and reports (see _get_analysis_runner)
+        llm = Settings.llm
         
         # Create LlamaIndex tools
         llama_tools = self.tool_manager.create_llama_index_tools(self.report_definition)
         
-        # Create agent
-        agent_worker = FunctionCallingAgentWorker.from_tools(
-            tools=llama_tools,
-            llm=Settings.llm,
-            verbose=True,
-            max_function_calls=self.report_definition.agent_configuration.max_iterations
+        def create_agent() -> AgentRunner:
+            agent_worker = FunctionCallingAgentWorker.from_tools(
+                tools=llama_tools,
+                llm=llm,
+                verbose=True,
+                max_function_calls=self.report_definition.agent_configuration.max_iterations
+            )
+            return AgentRunner(agent_worker)
+        
+        # Tasks are independent network round-trips; bound how many are in flight at once
+        semaphore = asyncio.Semaphore(max_concurrent_tasks)
+        rate_limiter = TokenBucketRateLimiter(
+            self.config.get('max_requests_per_minute', 60),
+            self.config.get('max_tokens_per_minute', 90000)
         )
-        agent = AgentRunner(agent_worker)
         
-        # Execute each analysis task
-        for task in self.report_definition.analysis_tasks:
-            print(f"Executing analysis task: {task.name}")
-            
-            try:
-                # Build task prompt
-                task_prompt = f"""
-                Task: {task.description}
-                Priority: {task.priority}
-                
-                Available data from collection phase:
-                {json.dumps(collection_data, indent=2)}
-                
-                Please analyze this data and provide structured results according to the task requirements.
-                Focus on: {task.description}
+        agent_config = self.report_definition.agent_configuration
+        semantic_cache = SemanticCache(
+            ttl_seconds=agent_config.cache_ttl_seconds
+        ) if self.config.get('semantic_cache', False) else None
+        
+        # The collection data is identical for every task, so serialize it only once
+        prompt_data = self._prompt_collection_data(collection_data)
+        prompt_prefix = TASK_PROMPT_PREFIX + _to_json(prompt_data)
+        
+        # Cached responses are only reused for the same repository and the same collected
+        # data; the cache file is shared by every repository on the machine
+        cache_scope = f"{os.path.realpath(os.getcwd())}:{self._collection_fingerprint(prompt_data)}"
+        
+        def build_task_part(task) -> str:
+            return TASK_PROMPT_SUFFIX.format(
+                description=task.description,
+                priority=task.priority,
+                tool_sequence=_to_json(task.tool_sequence)
+            )
+        
+        async def query(task_prompt: str) -> str:
+            # Each task gets its own agent so concurrent runs don't share chat memory
+            response = await create_agent().aquery(task_prompt)
+            return response.response
+        
+        async def run_task(task) -> tuple:
+            async with semaphore:
+                print(f"Executing analysis task: {task.name}")
                 
-                Tool sequence to follow:
-                {json.dumps(task.tool_sequence, indent=2)}
-                """
+                task_part = build_task_part(task)
+                task_prompt = prompt_prefix + task_part
                 
-                # Execute with agent
-                response = agent.query(task_prompt)
+                # The same task over the same repository and data is answered from an earlier run.
+                # The scope already pins the data and the task, so the lookup is an exact match on
+                # the task part; an embedding would cost a model call without ever matching more
+                cache_key = f"{cache_scope}:{task.name}"
+                if semantic_cache is not None:
+                    cached_response = semantic_cache.lookup(task_part, scope=cache_key)
+                    if cached_response is not None:
+                        return cached_response, True
                 
+                response = await retry_with_backoff(
+                    query, task_prompt,
+                    retry_on=_retryable_llm_errors(),
+                    max_attempts=self.config.get('max_retries', 5)
+                )
+                if semantic_cache is not None:
+                    semantic_cache.store(task_part, None, response, scope=cache_key)
+                return response, False
+        
+        tasks = self.report_definition.analysis_tasks
+        # Every LLM request the agents make is charged to this run's limiter (see _rate_limited_openai_class)
+        limiter_token = _RATE_LIMITER.set(rate_limiter)
+        try:
+            results = await asyncio.gather(*(run_task(task) for task in tasks), return_exceptions=True)
+        finally:
+            _RATE_LIMITER.reset(limiter_token)
+        
+        for task, result in zip(tasks, results):
+            if isinstance(result, Exception):
+                error_msg = f"Error executing analysis task '{task.name}': {result}"
+                print(f"Error: {error_msg}")
                 analysis_results[task.name] = {
-                    'success': True,
-                    'result': response.response,
+                    'success': False,
+                    'error': error_msg,
                     'priority': task.priority,
                     'description': task.description
                 }
-                
-            except Exception as e:
-                error_msg = f"Error executing analysis task '{task.name}': {e}"
-                print(f"Error: {error_msg}")
+            else:
+                response, cached = result
                 analysis_results[task.name] = {
-                    'success': False,
-                    'error': error_msg,
+                    'success': True,
+                    'result': response,
+                    'cached': cached,
                     'priority': task.priority,
                     'description': task.description
                 }
         
         return analysis_results
     
-    def _format_xml_output(self, collection_data: Dict[str, Any], analysis_results: Dict[str, Any]) -> str:
-        """Format results as XML output."""
-        # Create root element
-        root = ET.Element('report')
-        
-        # Add metadata
-        metadata = ET.SubElement(root, 'metadata')
+    def _xml_metadata(self) -> ET.Element:
+        """Build the report metadata element."""
+        metadata = ET.Element('metadata')
         ET.SubElement(metadata, 'name').text = self.report_definition.metadata.name
         ET.SubElement(metadata, 'version').text = self.report_definition.metadata.version
         ET.SubElement(metadata, 'generated_at').text = datetime.now().isoformat()
         ET.SubElement(metadata, 'description').text = self.report_definition.metadata.description
+        return metadata
+    
+    def _xml_command(self, cmd_name: str, result: Dict[str, Any]) -> ET.Element:
+        """Build the element for one bash command result."""
+        cmd_element = ET.Element('command')
+        cmd_element.set('name', cmd_name)
+        cmd_element.set('success', str(result['success']).lower())
         
-        # Add data collection results
-        data_section = ET.SubElement(root, 'data_collection')
-        
-        # Bash commands results
-        bash_section = ET.SubElement(data_section, 'bash_commands')
-        for cmd_name, result in collection_data['bash_commands'].items():
-            cmd_element = ET.SubElement(bash_section, 'command')
-            cmd_element.set('name', cmd_name)
-            cmd_element.set('success', str(result['success']).lower())
+        if result['success']:
+            ET.SubElement(cmd_element, 'output').text = _xml_text(result.get('output', ''))
+            ET.SubElement(cmd_element, 'execution_time').text = str(result.get('execution_time', 0))
+        else:
+            ET.SubElement(cmd_element, 'error').text = _xml_text(result.get('error', ''))
+        return cmd_element
+    
+    def _xml_file_analysis(self, file_analysis: Dict[str, Any]) -> ET.Element:
+        """Build the file analysis element."""
+        file_section = ET.Element('file_analysis')
+        files_found = file_analysis.get('files_found', {})
+        if files_found.get('success'):
+            ET.SubElement(file_section, 'files_count').text = str(files_found.get('count', 0))
             
-            if result['success']:
-                ET.SubElement(cmd_element, 'output').text = result.get('output', '')
-                ET.SubElement(cmd_element, 'execution_time').text = str(result.get('execution_time', 0))
-            else:
-                ET.SubElement(cmd_element, 'error').text = result.get('error', '')
-        
-        # File analysis results
-        if collection_data['file_analysis']:
-            file_section = ET.SubElement(data_section, 'file_analysis')
-            files_found = collection_data['file_analysis'].get('files_found', {})
-            if files_found.get('success'):
-                ET.SubElement(file_section, 'files_count').text = str(files_found.get('count', 0))
-                
-                analyzed_files = collection_data['file_analysis'].get('analyzed_files', [])
-                for file_info in analyzed_files:
-                    file_element = ET.SubElement(file_section, 'analyzed_file')
-                    file_element.set('path', file_info['path'])
-                    file_element.set('size', str(file_info['size']))
-                    ET.SubElement(file_element, 'content_preview').text = file_info['content_preview']
+            analyzed_files = file_analysis.get('analyzed_files', [])
+            for file_info in analyzed_files:
+                file_element = ET.SubElement(file_section, 'analyzed_file')
+                file_element.set('path', file_info['path'])
+                file_element.set('size', str(file_info['size']))
+                ET.SubElement(file_element, 'content_preview').text = _xml_text(file_info['content_preview'])
+        return file_section
+    
+    def _xml_report_tail(self, collection_data: Dict[str, Any], analysis_results: Dict[str, Any]) -> List[ET.Element]:
+        """Build the analysis results, errors and tools sections that follow data collection."""
+        sections = []
         
         # Add analysis results
-        analysis_section = ET.SubElement(root, 'analysis_results')
+        analysis_section = ET.Element('analysis_results')
+        sections.append(analysis_section)
         
         for task_name, task_result in analysis_results.items():
             task_element = ET.SubElement(analysis_section, 'task')
             task_element.set('name', task_name)
             task_element.set('priority', task_result['priority'])
             task_element.set('success', str(task_result['success']).lower())
+            if task_result.get('cached'):
+                task_element.set('cached', 'true')
             
             ET.SubElement(task_element, 'description').text = task_result['description']
             
             if task_result['success']:
-                ET.SubElement(task_element, 'result').text = task_result['result']
+                ET.SubElement(task_element, 'result').text = _xml_text(task_result['result'])
             else:
-                ET.SubElement(task_element, 'error').text = task_result.get('error', '')
+                ET.SubElement(task_element, 'error').text = _xml_text(task_result.get('error', ''))
         
         # Add errors section if any
         if collection_data['errors']:
-            errors_section = ET.SubElement(root, 'errors')
+            errors_section = ET.Element('errors')
+            sections.append(errors_section)
             for error in collection_data['errors']:
-                ET.SubElement(errors_section, 'error').text = error
+                ET.SubElement(errors_section, 'error').text = _xml_text(error)
         
         # Add tool information
-        tools_section = ET.SubElement(root, 'tools_used')
+        tools_section = ET.Element('tools_used')
+        sections.append(tools_section)
         tool_status = self.tool_manager.get_tool_status()
         
         global_tools = ET.SubElement(tools_section, 'global_tools')
@@ -247,28 +502,83 @@ class XMLReportGenerator:
         for tool_name in tool_status['report_tools']['tools']:
             ET.SubElement(report_tools, 'tool').text = tool_name
         
+        return sections
+    
+    def _format_xml_output(self, collection_data: Dict[str, Any], analysis_results: Dict[str, Any]) -> str:
+        """Format results as XML output."""
+        root = ET.Element('report')
+        root.append(self._xml_metadata())
+        
+        # Add data collection results
+        data_section = ET.SubElement(root, 'data_collection')
+        bash_section = ET.SubElement(data_section, 'bash_commands')
+        for cmd_name, result in collection_data['bash_commands'].items():
+            bash_section.append(self._xml_command(cmd_name, result))
+        if collection_data['file_analysis']:
+            data_section.append(self._xml_file_analysis(collection_data['file_analysis']))
+        
+        root.extend(self._xml_report_tail(collection_data, analysis_results))
+        
         # Format XML with pretty printing
-        self._indent_xml(root)
+        if LXML_AVAILABLE:
+            return ET.tostring(root, encoding='unicode', pretty_print=True)
+        ET.indent(root, space="  ")
         return ET.tostring(root, encoding='unicode')
     
-    def _indent_xml(self, elem, level=0):
-        """Add pretty printing indentation to XML."""
-        i = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-            for elem in elem:
-                self._indent_xml(elem, level + 1)
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = i
+    def _write_xml_output(self, collection_data: Dict[str, Any], analysis_results: Dict[str, Any], output_file: str) -> None:
+        """Write the XML report to a file.
+        
+        With lxml the report is streamed: each command result and section is serialized
+        and released as soon as it is built, so neither the whole tree nor the whole
+        document is held in memory at once.
+        """
+        if not LXML_AVAILABLE:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write("<?xml version='1.0' encoding='utf-8'?>\n")
+                f.write(self._format_xml_output(collection_data, analysis_results))
+            return
+        
+        def write(xf, element: ET.Element, level: int) -> None:
+            ET.indent(element, space="  ", level=level)
+            xf.write("\n" + "  " * level, element)
+        
+        with open(output_file, 'wb') as f:
+            with ET.xmlfile(f, encoding='utf-8') as xf:
+                xf.write_declaration()
+                with xf.element('report'):
+                    write(xf, self._xml_metadata(), 1)
+                    xf.write("\n  ")
+                    with xf.element('data_collection'):
+                        bash_commands = collection_data['bash_commands']
+                        if bash_commands:
+                            xf.write("\n    ")
+                            with xf.element('bash_commands'):
+                                for cmd_name, result in bash_commands.items():
+                                    write(xf, self._xml_command(cmd_name, result), 3)
+                                xf.write("\n    ")
+                        else:
+                            write(xf, ET.Element('bash_commands'), 2)
+                        if collection_data['file_analysis']:
+                            write(xf, self._xml_file_analysis(collection_data['file_analysis']), 2)
+                        xf.write("\n  ")
+                    for section in self._xml_report_tail(collection_data, analysis_results):
+                        write(xf, section, 1)
+                    xf.write("\n")
+            # Text cannot follow the root element inside xmlfile, so end the file here
+            f.write(b"\n")
     
-    def generate_report(self) -> str:
-        """Generate the complete report."""
+    def generate_report(self, output_file: Optional[str] = None) -> str:
+        """Generate the complete report.
+        
+        Returns the report text, or, when output_file is given, writes the report
+        there and returns the path.
+        
+        This call is synchronous and blocks the calling thread until the report is done.
+        Called from a thread that runs an event loop, it runs the analysis on a worker
+        thread but still blocks that loop meanwhile, so async callers should use
+        loop.run_in_executor(). Reports generated from several threads at once run
+        their analysis phases one after another.
+        """
         print(f"Generating XML report: {self.report_definition.metadata.name}")
         print(f"Using {len(self.tool_manager.global_tools)} global tools and {len(self.tool_manager.report_tools)} report tools")
         
@@ -279,22 +589,31 @@ class XMLReportGenerator:
             
             # Execute analysis tasks
             print("Phase 2: Analysis")
-            analysis_results = self._execute_analysis_tasks(collection_data)
+            analysis_results = _run_analysis(self._execute_analysis_tasks(collection_data))
             
             # Format output
             print("Phase 3: Formatting Output")
             if self.report_definition.output_format.format.lower() == 'xml':
+                if output_file:
+                    self._write_xml_output(collection_data, analysis_results, output_file)
+                    print("Report generation completed successfully")
+                    return output_file
                 output = self._format_xml_output(collection_data, analysis_results)
             else:
                 # Fallback to JSON if XML formatting fails
-                output = json.dumps({
+                output = _to_json({
                     'metadata': {
                         'name': self.report_definition.metadata.name,
                         'generated_at': datetime.now().isoformat()
                     },
                     'data_collection': collection_data,
                     'analysis_results': analysis_results
-                }, indent=2)
+                })
+            
+            if output_file:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write(output)
+                output = output_file
             
             print("Report generation completed successfully")
             return output
@@ -305,8 +624,13 @@ class XMLReportGenerator:
             
             # Return error XML
             root = ET.Element('report_error')
-            ET.SubElement(root, 'message').text = error_msg
+            ET.SubElement(root, 'message').text = _xml_text(error_msg)
             ET.SubElement(root, 'timestamp').text = datetime.now().isoformat()
             ET.SubElement(root, 'report_name').text = self.report_definition.metadata.name
             
-            return ET.tostring(root, encoding='unicode')
\ No newline at end of file
+            error_output = ET.tostring(root, encoding='unicode')
+            if output_file:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write(error_output)
+                return output_file
+            return error_output
\ No newline at end of file
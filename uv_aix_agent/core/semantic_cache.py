@@ -0,0 +1,122 @@
+"""Semantic cache for analysis task responses."""
+
+import hashlib
+import json
+import math
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_CACHE_FILE = Path.home() / '.cache' / 'uv-aix-agent' / 'semantic_cache.jsonl'
+
+
+def _dumps(entry: Dict[str, Any]) -> str:
+    # Entries are mostly embedding floats, which orjson encodes many times faster
+    if orjson is not None:
+        return orjson.dumps(entry).decode()
+    return json.dumps(entry)
+
+
+def _loads(line: str) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else list(vector)
+
+
+class SemanticCache:
+    """Cache LLM responses keyed on prompts and, optionally, their embeddings.
+
+    A lookup returns the stored response of an identical earlier prompt in the same scope
+    (e.g. analysis task). When given an embedding it otherwise falls back to the most
+    similar embedded prompt whose cosine similarity reaches the threshold. Entries are
+    appended to a JSONL file and dropped on load once they are older than the TTL.
+    """
+
+    def __init__(self, threshold: float = 0.95, ttl_seconds: int = 86400,
+                 cache_file: Path = DEFAULT_CACHE_FILE):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.cache_file = Path(cache_file)
+        self.entries: List[Dict[str, Any]] = self._load()
+
+    def _load(self) -> List[Dict[str, Any]]:
+        cutoff = time.time() - self.ttl_seconds
+        entries = []
+        stale = False
+        try:
+            with open(self.cache_file, 'r') as f:
+                for line in f:
+                    try:
+                        entry = _loads(line)
+                    except ValueError:
+                        stale = True
+                        continue
+                    if entry.get('created_at', 0) >= cutoff:
+                        entries.append(entry)
+                    else:
+                        stale = True
+        except OSError:
+            return entries
+
+        # Compact the file so expired entries don't accumulate
+        if stale:
+            try:
+                with open(self.cache_file, 'w') as f:
+                    f.writelines(_dumps(entry) + '\n' for entry in entries)
+            except OSError:
+                pass
+        return entries
+
+    @staticmethod
+    def prompt_hash(prompt: str) -> str:
+        return hashlib.sha256(prompt.encode()).hexdigest()
+
+    def lookup(self, prompt: str, embedding: Optional[List[float]] = None,
+               scope: Optional[str] = None) -> Optional[str]:
+        """Return the cached response for an identical or, given an embedding, sufficiently similar prompt."""
+        cutoff = time.time() - self.ttl_seconds
+        prompt_hash = self.prompt_hash(prompt)
+        query = _normalize(embedding) if embedding is not None else None
+
+        best_entry, best_similarity = None, -1.0
+        for entry in self.entries:
+            if entry['created_at'] < cutoff or entry.get('scope') != scope:
+                continue
+            if entry['prompt_hash'] == prompt_hash:
+                return entry['response']
+            if query is None or entry.get('embedding') is None:
+                continue
+            similarity = sum(a * b for a, b in zip(query, entry['embedding']))
+            if similarity > best_similarity:
+                best_entry, best_similarity = entry, similarity
+
+        if best_entry is not None and best_similarity >= self.threshold:
+            return best_entry['response']
+        return None
+
+    def store(self, prompt: str, embedding: Optional[List[float]], response: str,
+              scope: Optional[str] = None) -> None:
+        """Remember a response; failing to persist it only costs a future cache miss."""
+        entry = {
+            'prompt_hash': self.prompt_hash(prompt),
+            'scope': scope,
+            'embedding': _normalize(embedding) if embedding is not None else None,
+            'response': response,
+            'created_at': time.time()
+        }
+        self.entries.append(entry)
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'a') as f:
+                f.write(_dumps(entry) + '\n')
+        except OSError:
+            pass
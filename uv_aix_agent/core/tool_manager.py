@@ -1,7 +1,8 @@
-from typing import Dict, Any, List, Optional, Type
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Type
+from dataclasses import dataclass
+import json
 from pathlib import Path
 import importlib
-from llama_index.core.tools import FunctionTool
 
 from .xml_parser import parse_global_tools, parse_report_definition, ToolConfig, GlobalToolsConfig, ReportDefinition
 try:
@@ -9,18 +10,34 @@ try:
 except ImportError:
     from tools.bash_tool import BashCommandTool, FileSystemTool, LLMAnalysisTool
 
+if TYPE_CHECKING:
+    from llama_index.core.tools import FunctionTool
+
+# Tools exposed to the agent as their own FunctionTools rather than through run_tool
+BUILTIN_AGENT_TOOLS = frozenset({'bash_executor', 'file_analyzer', 'llm_analyzer'})
+
+@dataclass(slots=True)
+class ToolEntry:
+    """A loaded tool instance together with the configuration it was created from."""
+    instance: Any
+    config: ToolConfig
+
 class ToolManager:
     """Manages global and report-specific tools."""
     
+    __slots__ = ('global_tools', 'report_tools', 'tool_classes', 'global_tools_config', '_all_tools_cache')
+    
     def __init__(self, global_tools_path: str = "config/global_tools.xml"):
-        self.global_tools: Dict[str, Any] = {}
-        self.report_tools: Dict[str, Any] = {}
+        self.global_tools: Dict[str, ToolEntry] = {}
+        self.report_tools: Dict[str, ToolEntry] = {}
         self.tool_classes: Dict[str, Type] = {
             'BashCommandTool': BashCommandTool,
             'FileSystemTool': FileSystemTool,
             'LLMAnalysisTool': LLMAnalysisTool,
         }
         self.global_tools_config: Optional[GlobalToolsConfig] = None
+        # (report_definition, inherit_global_tools, tools) from the last get_all_tools call
+        self._all_tools_cache: Optional[tuple] = None
         
         # Load global tools if file exists
         if Path(global_tools_path).exists():
@@ -50,15 +67,13 @@ class ToolManager:
     
     def load_global_tools(self, global_tools_path: str):
         """Load global tools from XML configuration."""
+        self._all_tools_cache = None
         try:
             self.global_tools_config = parse_global_tools(global_tools_path)
             
             for tool_config in self.global_tools_config.tools:
                 tool_instance = self.create_tool_instance(tool_config)
-                self.global_tools[tool_config.name] = {
-                    'instance': tool_instance,
-                    'config': tool_config
-                }
+                self.global_tools[tool_config.name] = ToolEntry(instance=tool_instance, config=tool_config)
                 
             print(f"Loaded {len(self.global_tools)} global tools")
             
@@ -69,50 +84,54 @@ class ToolManager:
     def load_report_tools(self, report_definition: ReportDefinition):
         """Load report-specific tools."""
         self.report_tools.clear()
+        self._all_tools_cache = None
         
         for tool_config in report_definition.tools:
             # Check dependencies
-            missing_deps = []
-            for dep in tool_config.dependencies:
-                if dep not in self.global_tools and dep not in self.report_tools:
-                    missing_deps.append(dep)
-            
-            if missing_deps:
+            missing = frozenset(tool_config.dependencies).difference(self.global_tools, self.report_tools)
+            if missing:
+                missing_deps = [dep for dep in tool_config.dependencies if dep in missing]
                 print(f"Warning: Tool {tool_config.name} missing dependencies: {missing_deps}")
                 continue
             
             try:
                 tool_instance = self.create_tool_instance(tool_config)
-                self.report_tools[tool_config.name] = {
-                    'instance': tool_instance,
-                    'config': tool_config
-                }
+                self.report_tools[tool_config.name] = ToolEntry(instance=tool_instance, config=tool_config)
             except Exception as e:
                 print(f"Error creating tool {tool_config.name}: {e}")
         
         print(f"Loaded {len(self.report_tools)} report-specific tools")
     
     def get_all_tools(self, report_definition: ReportDefinition) -> Dict[str, Any]:
-        """Get all available tools (global + report-specific)."""
+        """Get all available tools (global + report-specific).
+        
+        The mapping is cached until tools are reloaded; callers must not modify it.
+        """
+        inherit_global_tools = report_definition.metadata.inherit_global_tools
+        cached = self._all_tools_cache
+        if cached and cached[0] is report_definition and cached[1] == inherit_global_tools:
+            return cached[2]
+        
         all_tools = {}
         
         # Add global tools if inheritance is enabled
-        if report_definition.metadata.inherit_global_tools:
-            for name, tool_info in self.global_tools.items():
-                all_tools[name] = tool_info['instance']
+        if inherit_global_tools:
+            for name, entry in self.global_tools.items():
+                all_tools[name] = entry.instance
         
         # Add report-specific tools (can override global)
-        for name, tool_info in self.report_tools.items():
-            all_tools[name] = tool_info['instance']
+        for name, entry in self.report_tools.items():
+            all_tools[name] = entry.instance
         
+        self._all_tools_cache = (report_definition, inherit_global_tools, all_tools)
         return all_tools
     
     def get_tool(self, name: str) -> Optional[Any]:
         """Get a specific tool by name."""
         if name in self.report_tools:
-            return self.report_tools[name]['instance']
+            return self.report_tools[name].instance
         elif name in self.global_tools:
-            return self.global_tools[name]['instance']
+            return self.global_tools[name].instance
         return None
     
     def execute_bash_command(self, command: str, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -143,8 +162,10 @@ class ToolManager:
         
         return bash_tool.execute_multiple(commands)
     
-    def create_llama_index_tools(self, report_definition: ReportDefinition) -> List[FunctionTool]:
+    def create_llama_index_tools(self, report_definition: ReportDefinition) -> List['FunctionTool']:
         """Create LlamaIndex FunctionTool instances for agent use."""
+        from llama_index.core.tools import FunctionTool
+        
         tools = []
         all_tools = self.get_all_tools(report_definition)
         
@@ -207,56 +228,56 @@ class ToolManager:
             
             tools.extend([file_read_tool, file_list_tool])
         
-        # Create report-specific tools
-        for tool_name, tool_instance in all_tools.items():
-            if tool_name in ['bash_executor', 'file_analyzer', 'llm_analyzer']:
-                continue  # Already handled above
+        # Route every other tool through a single dispatcher so the agent's tool schema
+        # stays the same size no matter how many report-specific tools are loaded
+        other_tools = {
+            tool_name: tool_instance for tool_name, tool_instance in all_tools.items()
+            if tool_name not in BUILTIN_AGENT_TOOLS
+        }
+        if other_tools:
+            tool_descriptions = []
+            for tool_name in other_tools:
+                # Get tool configuration for description; report tools override global ones
+                entry = self.report_tools.get(tool_name) or self.global_tools.get(tool_name)
+                tool_config = entry.config if entry else None
+                description = tool_config.description if tool_config else f"Execute {tool_name} tool"
+                tool_descriptions.append(f"- {tool_name}: {description}")
             
-            # Create generic wrapper for report-specific tools
-            def create_tool_wrapper(tool_name: str, tool_instance: Any):
-                def tool_wrapper(**kwargs) -> str:
-                    """Generic wrapper for report-specific tools."""
-                    try:
-                        # Try to call a standard method if it exists
-                        if hasattr(tool_instance, 'execute'):
-                            result = tool_instance.execute(**kwargs)
-                        elif hasattr(tool_instance, 'analyze'):
-                            result = tool_instance.analyze(**kwargs)
-                        else:
-                            return f"Tool {tool_name} does not have a standard interface"
-                        
-                        if isinstance(result, dict) and 'success' in result:
-                            if result['success']:
-                                return str(result.get('output', result.get('result', 'Success')))
-                            else:
-                                return f"Tool {tool_name} failed: {result.get('error', 'Unknown error')}"
-                        else:
-                            return str(result)
-                    except Exception as e:
-                        return f"Tool {tool_name} error: {e}"
+            def run_tool(tool_name: str, args_json: str = "{}") -> str:
+                """Invoke a report tool by name with JSON-encoded keyword arguments."""
+                tool_instance = other_tools.get(tool_name)
+                if tool_instance is None:
+                    return f"Unknown tool: {tool_name}. Available tools: {', '.join(other_tools)}"
                 
-                return tool_wrapper
-            
-            # Get tool configuration for description
-            tool_config = None
-            for name, tool_info in self.report_tools.items():
-                if name == tool_name:
-                    tool_config = tool_info['config']
-                    break
-            if not tool_config:
-                for name, tool_info in self.global_tools.items():
-                    if name == tool_name:
-                        tool_config = tool_info['config']
-                        break
-            
-            description = tool_config.description if tool_config else f"Execute {tool_name} tool"
+                try:
+                    kwargs = json.loads(args_json) if args_json else {}
+                    
+                    # Try to call a standard method if it exists
+                    if hasattr(tool_instance, 'execute'):
+                        result = tool_instance.execute(**kwargs)
+                    elif hasattr(tool_instance, 'analyze'):
+                        result = tool_instance.analyze(**kwargs)
+                    else:
+                        return f"Tool {tool_name} does not have a standard interface"
+                    
+                    if isinstance(result, dict) and 'success' in result:
+                        if result['success']:
+                            return str(result.get('output', result.get('result', 'Success')))
+                        else:
+                            return f"Tool {tool_name} failed: {result.get('error', 'Unknown error')}"
+                    else:
+                        return str(result)
+                except Exception as e:
+                    return f"Tool {tool_name} error: {e}"
             
-            tool_function = FunctionTool.from_defaults(
-                fn=create_tool_wrapper(tool_name, tool_instance),
-                name=tool_name,
-                description=description
-            )
-            tools.append(tool_function)
+            tools.append(FunctionTool.from_defaults(
+                fn=run_tool,
+                name="run_tool",
+                description=(
+                    "Invoke any report tool by name, passing its keyword arguments as a JSON object. "
+                    "Available tools:\n" + "\n".join(tool_descriptions)
+                )
+            ))
         
         return tools
     
@@ -282,16 +303,15 @@ class ToolManager:
             'warnings': []
         }
         
-        all_available_tools = set(self.global_tools.keys()) | set(tool.name for tool in report_definition.tools)
+        all_available_tools = frozenset(self.global_tools) | frozenset(tool.name for tool in report_definition.tools)
         
         for tool_config in report_definition.tools:
-            missing_deps = []
-            for dep in tool_config.dependencies:
-                if dep not in all_available_tools:
-                    missing_deps.append(dep)
-            
-            if missing_deps:
+            missing = frozenset(tool_config.dependencies) - all_available_tools
+            if missing:
                 validation_results['valid'] = False
-                validation_results['missing_dependencies'][tool_config.name] = missing_deps
+                # Report missing dependencies in declaration order
+                validation_results['missing_dependencies'][tool_config.name] = [
+                    dep for dep in tool_config.dependencies if dep in missing
+                ]
         
         return validation_results
\ No newline at end of file
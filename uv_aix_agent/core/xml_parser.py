@@ -1,9 +1,21 @@
-import xml.etree.ElementTree as ET
+# cython: language_level=3, boundscheck=False
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from pathlib import Path
+import functools
+import hashlib
+import json
+import os
+import pickle
+from sys import intern
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolConfig:
     name: str
     scope: str  # 'global' or 'report'
@@ -13,15 +25,15 @@ class ToolConfig:
     config: Dict[str, Any] = field(default_factory=dict)
     permissions: Dict[str, bool] = field(default_factory=dict)
     error_handling: Dict[str, str] = field(default_factory=dict)
-    dependencies: List[str] = field(default_factory=list)
+    dependencies: Tuple[str, ...] = ()
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GlobalToolsConfig:
     version: str
     description: str
     tools: List[ToolConfig] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReportMetadata:
     name: str
     version: str
@@ -30,26 +42,27 @@ class ReportMetadata:
     output_format: str
     author: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentConfiguration:
     prompt_template: str
     max_iterations: int
     temperature: float
     response_format: str = "structured"
+    cache_ttl_seconds: int = 86400
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BashCommand:
     name: str
     command: str
     tool: str
     timeout: int = 60
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DataCollection:
     bash_commands: List[BashCommand] = field(default_factory=list)
     file_analysis: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnalysisTask:
     name: str
     priority: str
@@ -57,20 +70,20 @@ class AnalysisTask:
     tool_sequence: List[Dict[str, str]] = field(default_factory=list)
     output_schema: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OutputFormat:
     format: str
     structure: Dict[str, Any] = field(default_factory=dict)
     styling: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ErrorHandling:
     bash_command_failures: Dict[str, str] = field(default_factory=dict)
     tool_failures: Dict[str, str] = field(default_factory=dict)
     timeout_seconds: int = 300
     fallback_output: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReportDefinition:
     metadata: ReportMetadata
     agent_configuration: AgentConfiguration
@@ -80,66 +93,147 @@ class ReportDefinition:
     error_handling: ErrorHandling
     tools: List[ToolConfig] = field(default_factory=list)
 
+# Parsed definitions are cached on disk so unchanged XML files are not walked again
+PARSE_CACHE_DIR = Path.home() / '.cache' / 'uv-aix-agent' / 'parsed'
+# This module defines the shape of cached results, so any change to it invalidates them
+_PARSER_VERSION = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+def _content_hash(xml_path: str) -> str:
+    with open(xml_path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def _disk_cached(parse_func: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Cache a parser's result in memory and on disk per XML file.
+    
+    Within a process, an unchanged (path, mtime, size) returns the same result object,
+    so callers must treat it as read-only. Across processes an unchanged mtime and size
+    load the pickled result without reading the file; otherwise a matching content
+    hash still avoids re-parsing.
+    """
+    @functools.lru_cache(maxsize=32)
+    def load(xml_path: str, mtime_ns: int, size: int) -> Any:
+        path_key = hashlib.blake2b(str(Path(xml_path).resolve()).encode(), digest_size=16).hexdigest()
+        cache_file = PARSE_CACHE_DIR / f"{parse_func.__name__}-{path_key}.pkl"
+        
+        cached = None
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('version') != _PARSER_VERSION:
+                cached = None
+        except Exception:
+            cached = None
+        
+        if cached and cached['mtime_ns'] == mtime_ns and cached['size'] == size:
+            return cached['result']
+        
+        content_hash = _content_hash(xml_path)
+        if cached and cached['content_hash'] == content_hash:
+            result = cached['result']
+        else:
+            result = parse_func(xml_path)
+        
+        try:
+            PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(temp_file, 'wb') as f:
+                pickle.dump({
+                    'version': _PARSER_VERSION,
+                    'mtime_ns': mtime_ns,
+                    'size': size,
+                    'content_hash': content_hash,
+                    'result': result
+                }, f)
+            os.replace(temp_file, cache_file)
+        except OSError:
+            pass
+        return result
+    
+    @functools.wraps(parse_func)
+    def wrapper(xml_path: str) -> Any:
+        try:
+            stat = os.stat(xml_path)
+        except OSError:
+            # Let the parser raise its own error
+            return parse_func(xml_path)
+        return load(os.path.abspath(xml_path), stat.st_mtime_ns, stat.st_size)
+    
+    wrapper.cache_clear = load.cache_clear
+    return wrapper
+
+# Comments would otherwise appear as child elements; whitespace-only text between
+# elements and the xml:id index are never used, so libxml2 needn't build them. The
+# configs declare no entities, so entity expansion is switched off entirely
+_LXML_PARSER_OPTIONS = dict(remove_comments=True, remove_blank_text=True, collect_ids=False, resolve_entities=False)
+_LXML_PARSER = ET.XMLParser(**_LXML_PARSER_OPTIONS) if LXML_AVAILABLE else None
+
+def _parse_xml(xml_path: str) -> ET.ElementTree:
+    """Parse an XML file, dropping comments so they never appear as child elements."""
+    if LXML_AVAILABLE:
+        return ET.parse(xml_path, _LXML_PARSER)
+    return ET.parse(xml_path)
+
+def _iterparse_xml(xml_path: str):
+    """Stream (event, element) pairs for completed elements, skipping comments."""
+    if LXML_AVAILABLE:
+        return ET.iterparse(xml_path, events=('end',), **_LXML_PARSER_OPTIONS)
+    return ET.iterparse(xml_path, events=('end',))
+
+def _text(parent: ET.Element, tag: str, default: Any = None) -> Any:
+    """Return the text of parent's first `tag` child, or default if there is no such child."""
+    element = parent.find(tag)
+    return element.text if element is not None else default
+
 def parse_tool_config(tool_element: ET.Element) -> ToolConfig:
     """Parse a tool XML element into a ToolConfig object."""
     name = tool_element.get('name', '')
     scope = tool_element.get('scope', 'global')
     priority = tool_element.get('priority', 'medium')
     
-    class_element = tool_element.find('class')
-    class_name = class_element.text if class_element is not None else ''
-    
-    description_element = tool_element.find('description')
-    description = description_element.text if description_element is not None else ''
-    
-    # Parse config
+    class_name = ''
+    description = ''
     config = {}
-    config_element = tool_element.find('config')
-    if config_element is not None:
-        for child in config_element:
-            if child.tag == 'allowed_commands':
-                allowed_commands = []
-                for cmd in child.findall('command'):
-                    allowed_commands.append({
+    permissions = {}
+    error_handling = {}
+    dependencies = ()
+    
+    # Walk the tool's children once rather than find()-ing each section. Keys taken from
+    # tag names repeat across every tool, so they are interned and shared between dicts
+    for section in tool_element:
+        tag = section.tag
+        if tag == 'class':
+            class_name = section.text
+        elif tag == 'description':
+            description = section.text
+        elif tag == 'config':
+            for child in section:
+                if child.tag == 'allowed_commands':
+                    config['allowed_commands'] = [{
                         'pattern': cmd.get('pattern', ''),
                         'description': cmd.get('description', '')
-                    })
-                config['allowed_commands'] = allowed_commands
-            elif child.tag == 'blocked_commands':
-                blocked_commands = []
-                for cmd in child.findall('command'):
-                    blocked_commands.append({
+                    } for cmd in child.iterfind('command')]
+                elif child.tag == 'blocked_commands':
+                    config['blocked_commands'] = [{
                         'pattern': cmd.get('pattern', ''),
                         'reason': cmd.get('reason', '')
-                    })
-                config['blocked_commands'] = blocked_commands
-            elif child.tag == 'allowed_extensions':
-                # Parse list format like [".py", ".js", ".ts"]
-                text = child.text.strip('[]')
-                config['allowed_extensions'] = [ext.strip('"') for ext in text.split(',')]
-            else:
-                config[child.tag] = child.text
-    
-    # Parse permissions
-    permissions = {}
-    permissions_element = tool_element.find('permissions')
-    if permissions_element is not None:
-        for perm in permissions_element:
-            permissions[perm.tag] = perm.text.lower() == 'true'
-    
-    # Parse error handling
-    error_handling = {}
-    error_element = tool_element.find('error_handling')
-    if error_element is not None:
-        for error in error_element:
-            error_handling[error.tag] = error.get('action', error.text)
-    
-    # Parse dependencies
-    dependencies = []
-    deps_element = tool_element.find('dependencies')
-    if deps_element is not None:
-        for dep in deps_element.findall('requires_tool'):
-            dependencies.append(dep.text)
+                    } for cmd in child.iterfind('command')]
+                elif child.tag == 'allowed_extensions':
+                    # Parse list format like [".py", ".js", ".ts"], which is a JSON array
+                    try:
+                        config['allowed_extensions'] = json.loads(child.text)
+                    except ValueError:
+                        text = child.text.strip('[]')
+                        config['allowed_extensions'] = [ext.strip().strip('"\'') for ext in text.split(',')]
+                else:
+                    config[intern(child.tag)] = child.text
+        elif tag == 'permissions':
+            for perm in section:
+                permissions[intern(perm.tag)] = perm.text.lower() == 'true'
+        elif tag == 'error_handling':
+            for error in section:
+                error_handling[intern(error.tag)] = error.get('action', error.text)
+        elif tag == 'dependencies':
+            dependencies = tuple(dep.text for dep in section.iterfind('requires_tool'))
     
     return ToolConfig(
         name=name,
@@ -153,25 +247,24 @@ def parse_tool_config(tool_element: ET.Element) -> ToolConfig:
         dependencies=dependencies
     )
 
+@_disk_cached
 def parse_global_tools(xml_path: str) -> GlobalToolsConfig:
     """Parse global tools XML configuration."""
     if not Path(xml_path).exists():
         raise FileNotFoundError(f"Global tools configuration not found: {xml_path}")
     
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-    
-    # Parse metadata
-    metadata = root.find('metadata')
-    version = metadata.find('version').text if metadata and metadata.find('version') is not None else '1.0'
-    description = metadata.find('description').text if metadata and metadata.find('description') is not None else ''
-    
-    # Parse tools
+    version = '1.0'
+    description = ''
     tools = []
-    tools_element = root.find('tools')
-    if tools_element is not None:
-        for tool_element in tools_element.findall('tool'):
-            tools.append(parse_tool_config(tool_element))
+    
+    # Stream the file, handling metadata and each tool as soon as its element is complete
+    for _, element in _iterparse_xml(xml_path):
+        if element.tag == 'metadata':
+            version = element.findtext('version', '1.0')
+            description = element.findtext('description', '')
+        elif element.tag == 'tool':
+            tools.append(parse_tool_config(element))
+            element.clear()
     
     return GlobalToolsConfig(
         version=version,
@@ -207,8 +300,7 @@ def parse_analysis_tasks(tasks_element: ET.Element) -> List[AnalysisTask]:
             name = task_element.get('name', '')
             priority = task_element.get('priority', 'medium')
             
-            description_element = task_element.find('description')
-            description = description_element.text if description_element is not None else ''
+            description = _text(task_element, 'description', '')
             
             # Parse tool sequence
             tool_sequence = []
@@ -226,7 +318,7 @@ def parse_analysis_tasks(tasks_element: ET.Element) -> List[AnalysisTask]:
             schema_element = task_element.find('output_schema')
             if schema_element is not None:
                 for field in schema_element.findall('field'):
-                    field_name = field.get('name', '')
+                    field_name = intern(field.get('name', ''))
                     field_type = field.get('type', 'string')
                     output_schema[field_name] = {'type': field_type}
                     
@@ -246,36 +338,44 @@ def parse_analysis_tasks(tasks_element: ET.Element) -> List[AnalysisTask]:
     
     return tasks
 
+@_disk_cached
 def parse_report_definition(xml_path: str) -> ReportDefinition:
     """Parse report definition XML configuration."""
     if not Path(xml_path).exists():
         raise FileNotFoundError(f"Report definition not found: {xml_path}")
     
-    tree = ET.parse(xml_path)
+    tree = _parse_xml(xml_path)
     root = tree.getroot()
     
+    # Index the top-level sections in one pass; like find(), the first of a tag wins
+    sections = {}
+    for child in root:
+        sections.setdefault(child.tag, child)
+    
     # Parse metadata
-    metadata_element = root.find('metadata')
+    metadata_element = sections.get('metadata')
+    inherit_global_tools = _text(metadata_element, 'inherit_global_tools')
     metadata = ReportMetadata(
-        name=metadata_element.find('name').text if metadata_element.find('name') is not None else '',
-        version=metadata_element.find('version').text if metadata_element.find('version') is not None else '1.0',
-        description=metadata_element.find('description').text if metadata_element.find('description') is not None else '',
-        inherit_global_tools=metadata_element.find('inherit_global_tools').text.lower() == 'true' if metadata_element.find('inherit_global_tools') is not None else True,
-        output_format=metadata_element.find('output_format').text if metadata_element.find('output_format') is not None else 'xml',
-        author=metadata_element.find('author').text if metadata_element.find('author') is not None else None
+        name=_text(metadata_element, 'name', ''),
+        version=_text(metadata_element, 'version', '1.0'),
+        description=_text(metadata_element, 'description', ''),
+        inherit_global_tools=inherit_global_tools.lower() == 'true' if inherit_global_tools is not None else True,
+        output_format=_text(metadata_element, 'output_format', 'xml'),
+        author=_text(metadata_element, 'author')
     )
     
     # Parse agent configuration
-    agent_element = root.find('agent_configuration')
+    agent_element = sections.get('agent_configuration')
     agent_config = AgentConfiguration(
-        prompt_template=agent_element.find('prompt_template').text if agent_element.find('prompt_template') is not None else '',
-        max_iterations=int(agent_element.find('max_iterations').text) if agent_element.find('max_iterations') is not None else 3,
-        temperature=float(agent_element.find('temperature').text) if agent_element.find('temperature') is not None else 0.3,
-        response_format=agent_element.find('response_format').text if agent_element.find('response_format') is not None else 'structured'
+        prompt_template=_text(agent_element, 'prompt_template', ''),
+        max_iterations=int(_text(agent_element, 'max_iterations', 3)),
+        temperature=float(_text(agent_element, 'temperature', 0.3)),
+        response_format=_text(agent_element, 'response_format', 'structured'),
+        cache_ttl_seconds=int(_text(agent_element, 'cache_ttl_seconds', 86400))
     )
     
     # Parse data collection
-    data_collection_element = root.find('data_collection')
+    data_collection_element = sections.get('data_collection')
     bash_commands = parse_bash_commands(data_collection_element) if data_collection_element is not None else []
     
     file_analysis = {}
@@ -287,8 +387,8 @@ def parse_report_definition(xml_path: str) -> ReportDefinition:
                 file_analysis = {
                     'tool': analyze_files.get('tool', ''),
                     'pattern': analyze_files.get('pattern', ''),
-                    'check_for': analyze_files.find('check_for').text if analyze_files.find('check_for') is not None else '',
-                    'max_files': int(analyze_files.find('max_files').text) if analyze_files.find('max_files') is not None else 50
+                    'check_for': _text(analyze_files, 'check_for', ''),
+                    'max_files': int(_text(analyze_files, 'max_files', 50))
                 }
     
     data_collection = DataCollection(
@@ -297,26 +397,23 @@ def parse_report_definition(xml_path: str) -> ReportDefinition:
     )
     
     # Parse analysis tasks
-    tasks_element = root.find('analysis_tasks')
+    tasks_element = sections.get('analysis_tasks')
     analysis_tasks = parse_analysis_tasks(tasks_element)
     
     # Parse output format
-    output_element = root.find('output_format')
+    output_element = sections.get('output_format')
     output_format = OutputFormat(
-        format=output_element.find('format').text if output_element and output_element.find('format') is not None else 'xml'
+        format=_text(output_element, 'format', 'xml') if output_element is not None else 'xml'
     )
     
     # Parse error handling
-    error_element = root.find('error_handling')
-    error_handling = ErrorHandling()
-    if error_element is not None:
-        timeout_element = error_element.find('timeout_seconds')
-        if timeout_element is not None:
-            error_handling.timeout_seconds = int(timeout_element.text)
+    error_element = sections.get('error_handling')
+    timeout_seconds = _text(error_element, 'timeout_seconds') if error_element is not None else None
+    error_handling = ErrorHandling(timeout_seconds=int(timeout_seconds)) if timeout_seconds is not None else ErrorHandling()
     
     # Parse report-specific tools
     tools = []
-    tools_element = root.find('tools')
+    tools_element = sections.get('tools')
     if tools_element is not None:
         for tool_element in tools_element.findall('tool'):
             tools.append(parse_tool_config(tool_element))
@@ -18,6 +18,18 @@ from pathlib import Path
 # Load environment variables from .env file
 load_dotenv()
 
+def _first_xml_report(reports_dirs):
+    """Return the path of the first XML file found in the given directories, or None."""
+    for reports_dir in reports_dirs:
+        try:
+            with os.scandir(reports_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.xml') and entry.is_file():
+                        return entry.path
+        except OSError:
+            continue
+    return None
+
 def start():
     """
     Legacy entry point for backward compatibility.
@@ -56,22 +68,17 @@ def start():
         Path("reports")  # fallback to root reports
     ]
     
-    xml_reports = []
-    for reports_dir in reports_dirs:
-        if reports_dir.exists():
-            xml_reports.extend(reports_dir.glob("*.xml"))
-    
-    if not xml_reports:
+    # Use the first XML report found
+    report_xml_path = _first_xml_report(reports_dirs)
+    if report_xml_path is None:
         print("Error: No XML report definitions found in reports/ directories.")
         sys.exit(1)
     
-    # Use the first XML report found
-    report_xml_path = str(xml_reports[0])
     print(f"📊 Using XML report definition: {report_xml_path}")
     
     try:
         # Import the CLI functionality and execute a report
-        from cli import collect_git_data, calculate_metrics, generate_warnings, format_xml_report
+        from cli import collect_git_data, calculate_metrics, generate_warnings, build_xml_report, write_xml_report
         from datetime import datetime
         
         print("🔍 Collecting Git repository data...")
@@ -86,12 +93,11 @@ def start():
         warnings = generate_warnings(raw_data, metrics['lifetime_metrics'], metrics['recent_metrics'], errors)
         
         print("📝 Formatting XML report...")
-        xml_report = format_xml_report(raw_data, metrics, warnings, errors)
+        report_root = build_xml_report(raw_data, metrics, warnings, errors)
         
         # Save to file
         output_file = f"git_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xml"
-        with open(output_file, 'w') as f:
-            f.write(xml_report)
+        write_xml_report(report_root, output_file)
         
         print(f"\n✅ Report generated successfully!")
         print(f"📁 Saved to: {output_file}")
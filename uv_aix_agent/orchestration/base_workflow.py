@@ -1,7 +1,8 @@
 """Base workflow class for UV AI Agent."""
 
+import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 try:
     from ..actions.base_action import BaseAction, ActionContext, ActionError
 except ImportError:
@@ -15,7 +16,9 @@ class BaseWorkflow(ABC):
         self.name = name
         self.description = description
         self.actions: List[BaseAction] = []
-        self._logger = None
+        self._actions_built = False
+        self._required_tools: Optional[List[str]] = None
+        self._logger = logging.getLogger(f"uv_aix_agent.workflow.{name}")
     
     @abstractmethod
     def build_actions(self) -> List[BaseAction]:
@@ -27,6 +30,14 @@ class BaseWorkflow(ABC):
         """
         pass
     
+    def _ensure_actions(self) -> List[BaseAction]:
+        """Build the actions on first use; the list is a function of configuration, so reuse it."""
+        if not self._actions_built:
+            if not self.actions:
+                self.actions = self.build_actions()
+            self._actions_built = True
+        return self.actions
+    
     def execute(self, config: Dict[str, Any], tools: Dict[str, Any], 
                 initial_data: Dict[str, Any] = None) -> str:
         """
@@ -43,48 +54,48 @@ class BaseWorkflow(ABC):
         Raises:
             WorkflowError: If workflow execution fails
         """
+        # Initialize context
+        context = ActionContext(
+            data={},
+            config=config,
+            tools=tools,
+            metadata={'workflow_name': self.name}
+        )
+        # Route well-known keys such as raw_data into their typed slots
+        context.update(initial_data or {})
+        
+        # Build actions if not already built
         try:
-            # Initialize context
-            context = ActionContext(
-                data=initial_data or {},
-                config=config,
-                tools=tools,
-                metadata={'workflow_name': self.name}
-            )
-            
-            # Build actions if not already built
-            if not self.actions:
-                self.actions = self.build_actions()
+            actions = self._ensure_actions()
+        except Exception as e:
+            raise WorkflowError(self.name, f"Workflow execution failed: {e}", e)
+        action_count = len(actions)
+        
+        # Execute each action in sequence
+        for i, action in enumerate(actions, 1):
+            self._logger.debug("Executing action %d/%d: %s", i, action_count, action.name)
             
-            # Execute each action in sequence
-            for i, action in enumerate(self.actions):
-                print(f"Executing action {i+1}/{len(self.actions)}: {action.name}")
-                
+            try:
                 # Check if action can execute
                 if not action.can_execute(context):
-                    print(f"Warning: Skipping action '{action.name}' - requirements not met")
+                    self._logger.warning("Skipping action '%s' - requirements not met", action.name)
                     continue
                 
-                try:
-                    context = action.execute(context)
-                except ActionError as e:
-                    error_msg = f"Action '{action.name}' failed: {e}"
-                    if self.should_continue_on_error(action, e):
-                        print(f"Warning: {error_msg} - continuing workflow")
-                        continue
-                    else:
-                        raise WorkflowError(self.name, error_msg, e)
-                except Exception as e:
-                    error_msg = f"Unexpected error in action '{action.name}': {e}"
+                context = action.execute(context)
+            except ActionError as e:
+                error_msg = f"Action '{action.name}' failed: {e}"
+                if self.should_continue_on_error(action, e):
+                    self._logger.warning("%s - continuing workflow", error_msg)
+                    continue
+                else:
                     raise WorkflowError(self.name, error_msg, e)
-            
-            # Get final output
-            final_output = self.get_final_output(context)
-            
-            return final_output
-            
-        except WorkflowError:
-            raise
+            except Exception as e:
+                error_msg = f"Unexpected error in action '{action.name}': {e}"
+                raise WorkflowError(self.name, error_msg, e)
+        
+        # Get final output
+        try:
+            return self.get_final_output(context)
         except Exception as e:
             raise WorkflowError(self.name, f"Workflow execution failed: {e}", e)
     
@@ -132,14 +143,15 @@ class BaseWorkflow(ABC):
         Returns:
             List of required tool names
         """
-        if not self.actions:
-            self.actions = self.build_actions()
-        
-        required_tools = set()
-        for action in self.actions:
-            required_tools.update(action.get_required_tools())
+        # Actions are built once, so their combined requirements never change
+        if self._required_tools is None:
+            # Keys of a dict give a de-duplicated list in a stable, first-seen order
+            required_tools = {}
+            for action in self._ensure_actions():
+                required_tools.update(dict.fromkeys(action.get_required_tools()))
+            self._required_tools = list(required_tools)
         
-        return list(required_tools)
+        return list(self._required_tools)
     
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(name='{self.name}')"
@@ -207,7 +219,8 @@ class ConditionalWorkflow(BaseWorkflow):
 class ParallelWorkflow(BaseWorkflow):
     """Workflow that can execute some actions in parallel."""
     
-    def __init__(self, name: str, parallel_groups: List[List[BaseAction]], description: str = ""):
+    def __init__(self, name: str, parallel_groups: List[List[BaseAction]], description: str = "",
+                 max_workers: Optional[int] = None):
         """
         Initialize parallel workflow.
         
@@ -215,9 +228,11 @@ class ParallelWorkflow(BaseWorkflow):
             name: Workflow name
             parallel_groups: List of action groups, each group executes in parallel
             description: Workflow description
+            max_workers: Thread pool size for each parallel group (defaults to ParallelAction's)
         """
         super().__init__(name, description)
         self.parallel_groups = parallel_groups
+        self.max_workers = max_workers
     
     def build_actions(self) -> List[BaseAction]:
         """Build actions with parallel groups."""
@@ -236,7 +251,8 @@ class ParallelWorkflow(BaseWorkflow):
                 parallel_action = ParallelAction(
                     name=f"parallel_group_{i}",
                     actions=group,
-                    description=f"Parallel execution of {len(group)} actions"
+                    description=f"Parallel execution of {len(group)} actions",
+                    max_workers=self.max_workers
                 )
                 actions.append(parallel_action)
         
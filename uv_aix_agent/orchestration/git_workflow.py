@@ -12,6 +12,15 @@ except ImportError:
 class GitAnalysisWorkflow(BaseWorkflow):
     """Workflow for comprehensive Git repository analysis using dynamic XML definitions."""
     
+    # Analysis task name -> result flag it sets
+    _RESULT_KEYS = {
+        'git_data_collection': 'data_collected',
+        'calculate_derived_metrics': 'metrics_calculated',
+        'generate_warnings': 'warnings_generated',
+        'generate_comprehensive_report': 'report_generated',
+        'generate_insights': 'insights_generated'
+    }
+    
     def __init__(self, report_definition: Dict[str, Any] = None):
         super().__init__(
             name="git_analysis",
@@ -41,17 +50,9 @@ class GitAnalysisWorkflow(BaseWorkflow):
         
         # Each task in the XML definition would be executed here
         for task in analysis_tasks:
-            task_name = task.get('name', '')
-            if task_name == 'git_data_collection':
-                results['data_collected'] = True
-            elif task_name == 'calculate_derived_metrics':
-                results['metrics_calculated'] = True
-            elif task_name == 'generate_warnings':
-                results['warnings_generated'] = True
-            elif task_name == 'generate_comprehensive_report':
-                results['report_generated'] = True
-            elif task_name == 'generate_insights':
-                results['insights_generated'] = True
+            result_key = self._RESULT_KEYS.get(task.get('name', ''))
+            if result_key:
+                results[result_key] = True
         
         return results
     
@@ -91,6 +92,9 @@ class GitAnalysisWorkflow(BaseWorkflow):
 class GitSecurityWorkflow(BaseWorkflow):
     """Workflow focused on Git repository security analysis using dynamic XML definitions."""
     
+    # Security workflow focuses on data collection and warning generation
+    _HANDLED_TASKS = frozenset({'git_data_collection', 'generate_warnings'})
+    
     def __init__(self, report_definition: Dict[str, Any] = None):
         super().__init__(
             name="git_security",
@@ -111,8 +115,7 @@ class GitSecurityWorkflow(BaseWorkflow):
         
         for task in analysis_tasks:
             task_name = task.get('name', '')
-            # Security workflow focuses on data collection and warning generation
-            if task_name in ['git_data_collection', 'generate_warnings']:
+            if task_name in self._HANDLED_TASKS:
                 results[task_name] = True
         
         return results
@@ -129,6 +132,9 @@ class GitSecurityWorkflow(BaseWorkflow):
 class GitBasicWorkflow(BaseWorkflow):
     """Simplified workflow for basic Git repository analysis using dynamic XML definitions."""
     
+    # Basic workflow only does data collection and basic reporting
+    _HANDLED_TASKS = frozenset({'git_data_collection', 'generate_comprehensive_report'})
+    
     def __init__(self, report_definition: Dict[str, Any] = None):
         super().__init__(
             name="git_basic",
@@ -144,12 +150,11 @@ class GitBasicWorkflow(BaseWorkflow):
         """Execute basic workflow using XML report definition."""
         results = {}
         
-        # Basic workflow only does data collection and basic reporting
         analysis_tasks = report_definition.get('analysis_tasks', [])
         
         for task in analysis_tasks:
             task_name = task.get('name', '')
-            if task_name in ['git_data_collection', 'generate_comprehensive_report']:
+            if task_name in self._HANDLED_TASKS:
                 results[task_name] = True
         
         return results
@@ -159,6 +164,21 @@ class GitBasicWorkflow(BaseWorkflow):
         return True
 
 
+# Report-name keywords checked in order; the first match picks the workflow class
+_WORKFLOW_DISPATCH = (
+    ('security', GitSecurityWorkflow),
+    ('basic', GitBasicWorkflow),
+)
+_DEFAULT_WORKFLOW = GitAnalysisWorkflow
+
+
+def _report_name(metadata: Any) -> str:
+    """Read the lowercased report name from a ReportMetadata or a metadata dict."""
+    if hasattr(metadata, 'name'):
+        return metadata.name.lower()
+    return metadata.get('name', '').lower()
+
+
 def create_workflow_from_config(workflow_config: Dict[str, Any]) -> BaseWorkflow:
     """
     Factory function to create workflow from XML configuration.
@@ -169,15 +189,9 @@ def create_workflow_from_config(workflow_config: Dict[str, Any]) -> BaseWorkflow
     Returns:
         Appropriate workflow instance configured with XML definition
     """
-    metadata = workflow_config.get('metadata', {})
-    if hasattr(metadata, 'name'):
-        report_name = metadata.name.lower()
-    else:
-        report_name = metadata.get('name', '').lower()
-    
-    if 'security' in report_name:
-        return GitSecurityWorkflow(workflow_config)
-    elif 'basic' in report_name:
-        return GitBasicWorkflow(workflow_config)
-    else:
-        return GitAnalysisWorkflow(workflow_config)
\ No newline at end of file
+    report_name = _report_name(workflow_config.get('metadata', {}))
+    
+    for keyword, workflow_class in _WORKFLOW_DISPATCH:
+        if keyword in report_name:
+            return workflow_class(workflow_config)
+    return _DEFAULT_WORKFLOW(workflow_config)
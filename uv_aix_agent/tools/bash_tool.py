@@ -1,11 +1,240 @@
 import subprocess
 import re
 import os
+import shutil
+import select
 import signal
+import codecs
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import time
 
+class PersistentShellSession:
+    """A long-lived bash process that runs commands fed through its stdin.
+    
+    Each command runs in a subshell so `cd`, variables and `exit` don't leak into
+    the session, and is followed by a unique marker on stdout and stderr that frames
+    its output and carries its exit status. A timed-out or broken session is killed
+    and replaced on the next command. Commands run one at a time.
+    """
+    
+    def __init__(self, working_directory: str, shell: str = '/bin/bash'):
+        self.working_directory = working_directory
+        self.shell = shell
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+    
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is not None and self._proc.poll() is not None:
+            # Reap the exited shell and close its pipes before replacing it
+            self.close()
+        if self._proc is None:
+            self._proc = subprocess.Popen(
+                [self.shell, '-s'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=0,
+                cwd=self.working_directory,
+                start_new_session=True
+            )
+        return self._proc
+    
+    def close(self) -> None:
+        """Kill the shell and every process it started."""
+        if self._proc is not None:
+            try:
+                os.killpg(self._proc.pid, signal.SIGKILL)
+            except OSError:
+                pass
+            self._proc.wait()
+            for pipe in (self._proc.stdin, self._proc.stdout, self._proc.stderr):
+                pipe.close()
+            self._proc = None
+    
+    def run(self, command: str, timeout: float) -> Tuple[int, str, str]:
+        """Run a command, returning (return_code, stdout, stderr).
+        
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time
+            OSError: If the shell exited or its pipes broke
+        """
+        with self._lock:
+            proc = self._ensure_started()
+            marker = f"__uv_aix_done_{uuid.uuid4().hex}__".encode()
+            script = (
+                f"( {command}\n) </dev/null\n"
+                f"__rc=$?; printf '\\n%s %d\\n' {marker.decode()} $__rc; printf '\\n%s\\n' {marker.decode()} >&2\n"
+            )
+            
+            try:
+                proc.stdin.write(script.encode())
+                stdout, stderr = self._read_framed(proc, b'\n' + marker, time.monotonic() + timeout)
+            except subprocess.TimeoutExpired:
+                self.close()
+                raise subprocess.TimeoutExpired(command, timeout)
+            except OSError:
+                self.close()
+                raise
+            
+            output, _, status = stdout.rpartition(b'\n' + marker + b' ')
+            return (
+                int(status),
+                output.decode(errors='replace'),
+                stderr.decode(errors='replace')
+            )
+    
+    @staticmethod
+    def _read_framed(proc: subprocess.Popen, marker: bytes, deadline: float) -> Tuple[bytes, bytes]:
+        """Read stdout and stderr until each ends with the marker line."""
+        buffers = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+        frames = {proc.stdout: re.compile(re.escape(marker) + rb' -?\d+\n$'), proc.stderr: re.compile(re.escape(marker) + rb'\n$')}
+        pending = [proc.stdout, proc.stderr]
+        
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(proc.args, 0)
+            readable, _, _ = select.select(pending, [], [], remaining)
+            for pipe in readable:
+                chunk = os.read(pipe.fileno(), 65536)
+                if not chunk:
+                    raise OSError("Persistent shell exited unexpectedly")
+                buffer = buffers[pipe]
+                buffer += chunk
+                # The marker is only checked at the tail, so a scan never rereads old output
+                if frames[pipe].search(buffer, max(0, len(buffer) - len(marker) - 16)):
+                    pending.remove(pipe)
+        
+        stdout = bytes(buffers[proc.stdout][:-1])
+        stderr = bytes(buffers[proc.stderr][:-len(marker) - 1])
+        return stdout, stderr
+
+
+def _fuse_patterns(patterns: List[re.Pattern]) -> Optional[re.Pattern]:
+    """Combine patterns into one alternation whose group i+1 marks a match of patterns[i].
+    
+    Returns None when there is nothing to combine or a pattern has groups of its
+    own, since those would shift the group numbers and any backreferences.
+    """
+    if not patterns or any(pattern.groups for pattern in patterns):
+        return None
+    try:
+        return re.compile('|'.join(f'({pattern.pattern})' for pattern in patterns))
+    except re.error:
+        # e.g. inline global flags, which are only valid at the start of a pattern
+        return None
+
+
+# Commands made only of these characters mean the same with or without a shell
+_SIMPLE_COMMAND_RE = re.compile(r'[\w\-./=:@%+, ]+')
+
+
+def _simple_argv(command: str) -> Optional[List[str]]:
+    """Split a command that needs no shell features into argv, else return None.
+    
+    Commands whose program is not an executable found on PATH (shell builtins,
+    typos, paths relative to the working directory) also return None, so the
+    shell keeps resolving them and reporting errors.
+    """
+    if not _SIMPLE_COMMAND_RE.fullmatch(command):
+        return None
+    argv = command.split()
+    if not argv or '/' in argv[0] or shutil.which(argv[0]) is None:
+        return None
+    return argv
+
+
+# Leading run of characters that match themselves in a regex
+_LITERAL_PREFIX_RE = re.compile(r'[\w\- ]*')
+
+
+def _literal_prefixes(patterns: List[re.Pattern]) -> Optional[Tuple[str, ...]]:
+    """Return the literal text each pattern's matches must start with, for str.startswith.
+    
+    A command starting with none of them cannot match, so the regexes can be skipped.
+    Returns None when some pattern has no such prefix (alternations, leading wildcards
+    or flags), since every command then has to go through the regexes.
+    """
+    prefixes = []
+    for pattern in patterns:
+        if '|' in pattern.pattern:
+            return None
+        end = _LITERAL_PREFIX_RE.match(pattern.pattern).end()
+        prefix = pattern.pattern[:end]
+        # A quantifier makes the last literal character optional
+        if pattern.pattern[end:end + 1] in ('?', '*', '{'):
+            prefix = prefix[:-1]
+        if not prefix:
+            return None
+        prefixes.append(prefix)
+    return tuple(prefixes) if prefixes else None
+
+
+def _first_match(command: str, patterns: List[re.Pattern], fused: Optional[re.Pattern],
+                 prefixes: Optional[Tuple[str, ...]]) -> Optional[int]:
+    """Return the index of the first pattern that matches command, or None."""
+    if prefixes is not None and not command.startswith(prefixes):
+        return None
+    if fused is not None:
+        match = fused.match(command)
+        return match.lastindex - 1 if match else None
+    return next((i for i, pattern in enumerate(patterns) if pattern.match(command)), None)
+
+
+# Suggestions for common blocked commands, checked in order: (pattern, suggestions).
+# Command names must stand alone, so e.g. 'perform ' does not count as 'rm '.
+COMMAND_SUGGESTIONS = (
+    (re.compile(r'(?<![\w-])rm\s'), (
+        "Use 'ls' to list files instead of deleting",
+        "Consider using 'mv' to move files to a backup location"
+    )),
+    (re.compile(r'(?<![\w-])sudo\s'), (
+        "Try running without sudo if possible",
+        "Check if the operation can be done with current permissions"
+    )),
+    (re.compile(r'(?<![\w-])chmod\s'), (
+        "File permissions are managed by the system",
+        "Use 'ls -la' to check current permissions"
+    )),
+    (re.compile(r'>'), (
+        "IO redirection is disabled for security",
+        "Use command output directly in your analysis"
+    )),
+)
+
+
+# Default number of bytes of spooled stdout read back; the rest is dropped from the middle
+SPOOL_OUTPUT_LIMIT_BYTES = 1024 * 1024
+
+
+def _read_spool(spool, limit: int) -> Tuple[bytes, int]:
+    """Read back a spooled stdout file, keeping at most limit bytes from its head and tail.
+    
+    Returns the output and the number of bytes dropped from the middle.
+    """
+    size = spool.seek(0, os.SEEK_END)
+    spool.seek(0)
+    if size <= limit:
+        return spool.read(), 0
+    
+    head = spool.read(limit // 2)
+    tail_size = limit - len(head)
+    spool.seek(size - tail_size)
+    tail = spool.read(tail_size)
+    dropped = size - len(head) - len(tail)
+    return head + f"\n[... {dropped} bytes omitted ...]\n".encode() + tail, dropped
+
+
+# How long a validate_working_directory() verdict is reused for the same directory
+WORKING_DIRECTORY_RECHECK_SECONDS = 5.0
+
+
 class BashCommandTool:
     """Safe bash command execution tool with security restrictions."""
     
@@ -15,29 +244,40 @@ class BashCommandTool:
         self.working_directory = config.get('working_directory', 'auto_detect')
         self.allowed_commands = config.get('allowed_commands', [])
         self.blocked_commands = config.get('blocked_commands', [])
+        self.persistent_shell = str(config.get('persistent_shell', 'false')).lower() == 'true'
         
         # Set working directory
         if self.working_directory == 'auto_detect':
             self.working_directory = os.getcwd()
+        # The shell itself is only started by the first execute_persistent() call
+        self._session = PersistentShellSession(self.working_directory)
+        # Last validate_working_directory() verdict: (directory, valid, recheck deadline)
+        self._wd_check: Optional[Tuple[str, bool, float]] = None
         
         # Compile regex patterns for performance
         self.allowed_patterns = [re.compile(cmd['pattern']) for cmd in self.allowed_commands]
         self.blocked_patterns = [(re.compile(cmd['pattern']), cmd['reason']) for cmd in self.blocked_commands]
+        self._blocked_regexes = [pattern for pattern, _ in self.blocked_patterns]
+        # One alternation per list lets a single regex call find the first matching rule
+        self._allowed_re = _fuse_patterns(self.allowed_patterns)
+        self._blocked_re = _fuse_patterns(self._blocked_regexes)
+        # Literal text every match must start with; None when some pattern has none
+        self._allowed_prefixes = _literal_prefixes(self.allowed_patterns)
+        self._blocked_prefixes = _literal_prefixes(self._blocked_regexes)
     
     def is_command_allowed(self, command: str) -> Tuple[bool, Optional[str]]:
         """Check if a command is allowed to execute."""
         command = command.strip()
         
         # Check blocked commands first (security priority)
-        for pattern, reason in self.blocked_patterns:
-            if pattern.match(command):
-                return False, f"Command blocked: {reason}"
+        index = _first_match(command, self._blocked_regexes, self._blocked_re, self._blocked_prefixes)
+        if index is not None:
+            return False, f"Command blocked: {self.blocked_patterns[index][1]}"
         
         # Check allowed commands
         if self.allowed_patterns:
-            for pattern in self.allowed_patterns:
-                if pattern.match(command):
-                    return True, None
+            if _first_match(command, self.allowed_patterns, self._allowed_re, self._allowed_prefixes) is not None:
+                return True, None
             return False, "Command not in allowed list"
         
         # If no allowed patterns defined, allow by default (but still check blocked)
@@ -60,38 +300,75 @@ class BashCommandTool:
                 'execution_time': 0
             }
         
+        if self.persistent_shell:
+            return self.execute_persistent(command, timeout)
+        
         start_time = time.time()
         
+        # 'spool' lets the child write stdout straight to a temporary file instead of
+        # streaming it through a pipe, and reads back only its head and tail;
+        # 'drop' discards it when only the exit code matters
+        output_mode = config.get('large_output_mode', 'capture')
+        spool = None
+        
         try:
-            # Execute command with timeout
+            if output_mode == 'spool':
+                spool = tempfile.TemporaryFile()
+                stdout_target = spool
+            elif output_mode == 'drop':
+                stdout_target = subprocess.DEVNULL
+            else:
+                stdout_target = subprocess.PIPE
+            
+            # Execute command with timeout; simple commands skip the /bin/sh layer
+            argv = _simple_argv(command)
             process = subprocess.Popen(
-                command,
-                shell=True,
-                stdout=subprocess.PIPE,
+                argv or command,
+                shell=argv is None,
+                stdout=stdout_target,
                 stderr=subprocess.PIPE,
-                text=True,
                 cwd=self.working_directory,
-                preexec_fn=os.setsid  # Create new process group for cleanup
+                start_new_session=True  # New process group for cleanup; unlike preexec_fn, thread-safe
             )
             
             try:
+                # Pipes carry raw bytes, decoded once afterwards; undecodable output is replaced
                 stdout, stderr = process.communicate(timeout=timeout)
                 execution_time = time.time() - start_time
+                dropped = None
+                if spool is not None:
+                    limit = int(config.get('spool_output_limit_bytes', SPOOL_OUTPUT_LIMIT_BYTES))
+                    stdout, dropped = _read_spool(spool, limit)
                 
-                return {
+                result = {
                     'success': process.returncode == 0,
                     'return_code': process.returncode,
                     'command': command,
-                    'output': stdout,
-                    'stderr': stderr,
+                    'output': stdout.decode(errors='replace') if stdout else '',
+                    'stderr': stderr.decode(errors='replace'),
                     'execution_time': execution_time,
                     'working_directory': self.working_directory
                 }
+                if dropped is not None:
+                    result['output_bytes_dropped'] = dropped
+                return result
                 
             except subprocess.TimeoutExpired:
-                # Kill the entire process group
-                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-                process.communicate()  # Clean up
+                # Kill the entire process group, escalating if it ignores SIGTERM.
+                # Waiting instead of communicate() keeps a lingering grandchild that
+                # still holds the pipes from blocking recovery indefinitely.
+                try:
+                    os.killpg(process.pid, signal.SIGTERM)
+                    try:
+                        process.wait(timeout=1.0)
+                    except subprocess.TimeoutExpired:
+                        os.killpg(process.pid, signal.SIGKILL)
+                        process.wait()
+                except ProcessLookupError:
+                    process.wait()
+                for pipe in (process.stdout, process.stderr):
+                    if pipe:
+                        pipe.close()
                 
                 return {
                     'success': False,
@@ -113,9 +390,73 @@ class BashCommandTool:
                 'stderr': '',
                 'execution_time': execution_time
             }
+        finally:
+            if spool is not None:
+                spool.close()
     
-    def execute_multiple(self, commands: List[str]) -> List[Dict[str, Any]]:
-        """Execute multiple commands in sequence."""
+    def execute_persistent(self, command: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Execute a command in this tool's long-lived shell session.
+        
+        Saves a shell fork+exec per command, which adds up on platforms where
+        process creation is slow. Commands share one shell, so they run serially.
+        """
+        timeout = float(timeout if timeout is not None else self.timeout_seconds)
+        
+        is_allowed, reason = self.is_command_allowed(command)
+        if not is_allowed:
+            return {
+                'success': False,
+                'error': reason,
+                'command': command,
+                'output': '',
+                'stderr': '',
+                'execution_time': 0
+            }
+        
+        start_time = time.time()
+        try:
+            return_code, stdout, stderr = self._session.run(command, timeout)
+            return {
+                'success': return_code == 0,
+                'return_code': return_code,
+                'command': command,
+                'output': stdout,
+                'stderr': stderr,
+                'execution_time': time.time() - start_time,
+                'working_directory': self.working_directory
+            }
+        except subprocess.TimeoutExpired:
+            return {
+                'success': False,
+                'error': f'Command timed out after {timeout:g} seconds',
+                'command': command,
+                'output': '',
+                'stderr': '',
+                'execution_time': timeout,
+                'timeout': True
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Execution failed: {str(e)}',
+                'command': command,
+                'output': '',
+                'stderr': '',
+                'execution_time': time.time() - start_time
+            }
+    
+    def execute_multiple(self, commands: List[str], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Execute multiple commands, returning results in command order.
+        
+        Independent commands run concurrently on a thread pool. With stop_on_failure
+        or a persistent shell, which serializes commands anyway, they run in sequence.
+        """
+        if len(commands) > 1 and not self.persistent_shell and not self.config.get('stop_on_failure', False):
+            # Workers mostly wait on child processes, so allow more than one per CPU
+            max_workers = max_workers or min(len(commands), (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(self.execute, commands))
+        
         results = []
         for command in commands:
             result = self.execute(command)
@@ -129,34 +470,31 @@ class BashCommandTool:
     
     def get_command_suggestions(self, blocked_command: str) -> List[str]:
         """Suggest alternative commands for blocked ones."""
-        suggestions = []
-        
-        # Basic suggestions for common blocked patterns
-        if 'rm ' in blocked_command:
-            suggestions.append("Use 'ls' to list files instead of deleting")
-            suggestions.append("Consider using 'mv' to move files to a backup location")
-        
-        elif 'sudo ' in blocked_command:
-            suggestions.append("Try running without sudo if possible")
-            suggestions.append("Check if the operation can be done with current permissions")
-        
-        elif 'chmod ' in blocked_command:
-            suggestions.append("File permissions are managed by the system")
-            suggestions.append("Use 'ls -la' to check current permissions")
-        
-        elif '>' in blocked_command or '>>' in blocked_command:
-            suggestions.append("IO redirection is disabled for security")
-            suggestions.append("Use command output directly in your analysis")
-        
-        return suggestions
+        for pattern, suggestions in COMMAND_SUGGESTIONS:
+            if pattern.search(blocked_command):
+                return list(suggestions)
+        return []
     
     def validate_working_directory(self) -> bool:
-        """Validate that the working directory is safe and accessible."""
+        """Validate that the working directory is safe and accessible.
+        
+        The verdict is reused for a few seconds and rechecked at once if
+        working_directory is reassigned.
+        """
+        directory = self.working_directory
+        now = time.monotonic()
+        if self._wd_check is not None:
+            checked_directory, valid, valid_until = self._wd_check
+            if checked_directory == directory and now < valid_until:
+                return valid
+        
         try:
-            path = Path(self.working_directory)
-            return path.exists() and path.is_dir() and os.access(path, os.R_OK)
+            # isdir() already implies existence, so one stat plus the access check suffice
+            valid = os.path.isdir(directory) and os.access(directory, os.R_OK)
         except Exception:
-            return False
+            valid = False
+        self._wd_check = (directory, valid, now + WORKING_DIRECTORY_RECHECK_SECONDS)
+        return valid
     
     def get_allowed_commands_help(self) -> List[str]:
         """Get help text for allowed commands."""
@@ -173,6 +511,95 @@ class BashCommandTool:
         return help_text
 
 
+def _expand_braces(pattern: str) -> List[str]:
+    """Expand shell-style braces, e.g. '*.{py,md}' -> ['*.py', '*.md']."""
+    match = re.search(r'\{([^{}]*)\}', pattern)
+    if not match:
+        return [pattern]
+    head, tail = pattern[:match.start()], pattern[match.end():]
+    expanded = []
+    for option in match.group(1).split(','):
+        expanded.extend(_expand_braces(head + option + tail))
+    return expanded
+
+_GLOB_TOKEN_RE = re.compile(r'\*\*/|\*\*|\*|\?|\[!?\]?[^\]]*\]')
+
+def _translate_glob(pattern: str) -> str:
+    """Translate one brace-free glob into a regex over '/'-separated relative paths.
+    
+    '*', '?' and character classes stay within one path component; '**/' matches
+    any number of leading directories, including none, and a trailing '**' anything.
+    """
+    parts = []
+    position = 0
+    for token in _GLOB_TOKEN_RE.finditer(pattern):
+        parts.append(re.escape(pattern[position:token.start()]))
+        text = token.group()
+        if text == '**/':
+            parts.append('(?:.*/)?')
+        elif text == '**':
+            parts.append('.*')
+        elif text == '*':
+            parts.append('[^/]*')
+        elif text == '?':
+            parts.append('[^/]')
+        else:
+            body = text[1:-1].replace('\\', '\\\\')
+            if body.startswith('!'):
+                parts.append('[^/' + body[1:] + ']')
+            else:
+                # A leading '^' is literal in a glob class but would negate a regex one
+                parts.append('[' + ('\\' + body if body.startswith('^') else body) + ']')
+        position = token.end()
+    parts.append(re.escape(pattern[position:]))
+    return ''.join(parts)
+
+@lru_cache(maxsize=32)
+def compile_glob(pattern: str) -> re.Pattern:
+    """Compile a glob with brace expansion and '**/' into a single regex.
+    
+    The regex is matched against '/'-separated paths relative to the search root, so
+    '*.md' only matches files at the root and 'src/*.py' only files directly in src;
+    '**/' also matches files at the root itself.
+    """
+    alternatives = [_translate_glob(expanded) for expanded in _expand_braces(pattern)]
+    return re.compile('(?s:' + '|'.join(alternatives) + r')\Z')
+
+@lru_cache(maxsize=128)
+def compile_name_filter(pattern: str) -> re.Pattern:
+    """Compile a list_files name filter, reusing it across calls.
+    
+    Kept separate from re's own module-wide cache, which any other caller can evict.
+    """
+    return re.compile(pattern)
+
+
+# Dependency, virtualenv and build output directories find_files never descends into
+SKIPPED_DIRECTORIES = frozenset({
+    'node_modules', 'venv', 'env', '__pycache__', 'site-packages',
+    'build', 'dist', 'target'
+})
+
+# Block size for unbuffered file reads in FileSystemTool.read_file
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def _advise_sequential(fd: int, whole_file: bool) -> None:
+    """Tell the kernel a file will be read front to back so readahead can be more aggressive.
+    
+    For whole-file reads also ask it to start fetching everything now. The hints are
+    best effort and skipped on platforms without posix_fadvise.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if whole_file:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+
+
 class FileSystemTool:
     """Safe file system operations tool."""
     
@@ -180,28 +607,36 @@ class FileSystemTool:
         self.config = config
         self.max_file_size_mb = config.get('max_file_size_mb', 10)
         self.allowed_extensions = config.get('allowed_extensions', [])
+        # Set form of allowed_extensions for constant-time membership checks
+        self._allowed_extension_set = frozenset(self.allowed_extensions)
         self.read_files = config.get('read_files', True)
         self.write_files = config.get('write_files', False)
+        self.skipped_directories = frozenset(config.get('skipped_directories', SKIPPED_DIRECTORIES))
     
-    def is_file_allowed(self, file_path: str) -> Tuple[bool, Optional[str]]:
-        """Check if file operations are allowed on this file."""
-        path = Path(file_path)
+    def is_file_allowed(self, file_path: str, st: Optional[os.stat_result] = None) -> Tuple[bool, Optional[str]]:
+        """Check if file operations are allowed on this file.
         
-        # Check if file exists for read operations
-        if not path.exists():
-            return False, "File does not exist"
+        Callers that already have the file's stat result can pass it to skip the stat call.
+        """
+        # A single stat answers both whether the file exists and how big it is
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
+                return False, "File does not exist"
+            except OSError as e:
+                return False, f"Cannot check file size: {e}"
         
         # Check file size
-        try:
-            size_mb = path.stat().st_size / (1024 * 1024)
-            if size_mb > self.max_file_size_mb:
-                return False, f"File too large: {size_mb:.1f}MB > {self.max_file_size_mb}MB"
-        except Exception as e:
-            return False, f"Cannot check file size: {e}"
+        size_mb = st.st_size / (1024 * 1024)
+        if size_mb > self.max_file_size_mb:
+            return False, f"File too large: {size_mb:.1f}MB > {self.max_file_size_mb}MB"
         
         # Check extension if restricted
-        if self.allowed_extensions and path.suffix not in self.allowed_extensions:
-            return False, f"File extension {path.suffix} not allowed"
+        if self._allowed_extension_set:
+            suffix = Path(file_path).suffix
+            if suffix not in self._allowed_extension_set:
+                return False, f"File extension {suffix} not allowed"
         
         return True, None
     
@@ -223,57 +658,178 @@ class FileSystemTool:
             }
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            # Unbuffered binary reads: lines are counted on raw blocks and decoded once
+            with open(file_path, 'rb', buffering=0) as f:
+                _advise_sequential(f.fileno(), whole_file=not max_lines)
                 if max_lines:
-                    lines = []
-                    for i, line in enumerate(f):
-                        if i >= max_lines:
+                    data = bytearray()
+                    newlines = 0
+                    while newlines < max_lines:
+                        chunk = f.read(READ_CHUNK_SIZE)
+                        if not chunk:
                             break
-                        lines.append(line)
-                    content = ''.join(lines)
+                        data += chunk
+                        newlines += chunk.count(b'\n')
+                    # Keep everything up to and including the max_lines-th newline
+                    rest = data.split(b'\n', max_lines)
+                    if len(rest) > max_lines:
+                        del data[len(data) - len(rest[-1]):]
                 else:
-                    content = f.read()
+                    data = f.readall()
+            
+            content = data.decode('utf-8').replace('\r\n', '\n')
+            return {
+                'success': True,
+                'content': content,
+                'file_path': file_path,
+                'size_bytes': len(data)
+            }
                 
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Failed to read file: {e}',
+                'content': ''
+            }
+    
+    def read_preview(self, file_path: str, n_bytes: int = 500) -> Dict[str, Any]:
+        """Read only the first n_bytes of a file, for previews of possibly large files."""
+        if not self.read_files:
+            return {
+                'success': False,
+                'error': 'File reading not permitted',
+                'content': ''
+            }
+        
+        is_allowed, reason = self.is_file_allowed(file_path)
+        if not is_allowed:
+            return {
+                'success': False,
+                'error': reason,
+                'content': ''
+            }
+        
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read(n_bytes)
+                truncated = bool(f.read(1))
+            
+            # A non-final decode drops a multi-byte character cut off at the boundary
+            content = codecs.getincrementaldecoder('utf-8')(errors='replace').decode(data)
+            return {
+                'success': True,
+                'content': content,
+                'truncated': truncated,
+                'file_path': file_path
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Failed to read file: {e}',
+                'content': ''
+            }
+    
+    def find_files(self, directory: str, pattern: str, max_files: Optional[int] = None) -> Dict[str, Any]:
+        """Recursively find files matching a glob such as '**/*.{py,md}'.
+        
+        Hidden directories (e.g. .git, .venv) and skipped_directories are not
+        descended into. With max_files the walk stops as soon as that many files
+        are found and the result is marked truncated, since more may exist.
+        """
+        try:
+            if not os.path.isdir(directory):
                 return {
-                    'success': True,
-                    'content': content,
-                    'file_path': file_path,
-                    'size_bytes': len(content.encode('utf-8'))
+                    'success': False,
+                    'error': 'Directory does not exist or is not a directory',
+                    'files': []
                 }
+            
+            regex = compile_glob(pattern)
+            files = []
+            truncated = False
+            pending = ['']
+            while pending and not truncated:
+                relative_dir = pending.pop()
+                try:
+                    with os.scandir(os.path.join(directory, relative_dir)) as entries:
+                        entries = sorted(entries, key=lambda entry: entry.name)
+                except OSError:
+                    # Like os.walk, skip subdirectories that are unreadable or vanished mid-walk;
+                    # an unreadable search root still fails the whole call
+                    if not relative_dir:
+                        raise
+                    continue
+                
+                subdirectories = []
+                for entry in entries:
+                    relative_path = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.') and entry.name not in self.skipped_directories:
+                            subdirectories.append(relative_path)
+                    elif entry.is_file() and regex.match(relative_path):
+                        st = entry.stat()
+                        is_allowed, _ = self.is_file_allowed(entry.path, st)
+                        if is_allowed:
+                            files.append({
+                                'name': entry.name,
+                                'path': entry.path,
+                                'size_bytes': st.st_size,
+                                'extension': os.path.splitext(entry.name)[1]
+                            })
+                            if len(files) == max_files:
+                                truncated = True
+                                break
                 
+                # Depth-first, in name order
+                pending.extend(reversed(subdirectories))
+            
+            return {
+                'success': True,
+                'files': files,
+                'directory': directory,
+                'count': len(files),
+                'truncated': truncated
+            }
+            
         except Exception as e:
             return {
                 'success': False,
-                'error': f'Failed to read file: {e}',
-                'content': ''
+                'error': f'Failed to find files: {e}',
+                'files': []
             }
     
     def list_files(self, directory: str, pattern: Optional[str] = None) -> Dict[str, Any]:
         """List files in a directory."""
         try:
-            path = Path(directory)
-            if not path.exists() or not path.is_dir():
+            if not os.path.isdir(directory):
                 return {
                     'success': False,
                     'error': 'Directory does not exist or is not a directory',
                     'files': []
                 }
             
+            regex = compile_name_filter(pattern) if pattern else None
             files = []
-            for file_path in path.iterdir():
-                if file_path.is_file():
+            # DirEntry caches the file type from readdir and its stat result after the first call
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    
                     # Apply pattern filter if provided
-                    if pattern and not re.search(pattern, file_path.name):
+                    if regex and not regex.search(entry.name):
                         continue
                     
-                    # Check if file is allowed
-                    is_allowed, _ = self.is_file_allowed(str(file_path))
+                    # Check if file is allowed, reusing one stat for the size
+                    st = entry.stat()
+                    is_allowed, _ = self.is_file_allowed(entry.path, st)
                     if is_allowed:
                         files.append({
-                            'name': file_path.name,
-                            'path': str(file_path),
-                            'size_bytes': file_path.stat().st_size,
-                            'extension': file_path.suffix
+                            'name': entry.name,
+                            'path': entry.path,
+                            'size_bytes': st.st_size,
+                            'extension': os.path.splitext(entry.name)[1]
                         })
             
             return {
@@ -305,8 +861,7 @@ class LLMAnalysisTool:
         try:
             # Truncate text if too long
             if len(text) > self.max_context_tokens * 4:  # Rough token estimation
-                text = text[:self.max_context_tokens * 4]
-                text += "\n\n[TEXT TRUNCATED FOR ANALYSIS]"
+                text = text[:self.max_context_tokens * 4] + "\n\n[TEXT TRUNCATED FOR ANALYSIS]"
             
             full_prompt = f"{analysis_prompt}\n\nText to analyze:\n{text}"
             
@@ -329,9 +884,7 @@ class LLMAnalysisTool:
     def synthesize_findings(self, findings: List[Dict[str, Any]], synthesis_prompt: str, llm_instance) -> Dict[str, Any]:
         """Synthesize multiple findings into a cohesive analysis."""
         try:
-            findings_text = ""
-            for i, finding in enumerate(findings):
-                findings_text += f"Finding {i+1}:\n{finding}\n\n"
+            findings_text = ''.join(f"Finding {i}:\n{finding}\n\n" for i, finding in enumerate(findings, 1))
             
             full_prompt = f"{synthesis_prompt}\n\nFindings to synthesize:\n{findings_text}"
             
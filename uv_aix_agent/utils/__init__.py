@@ -1 +1,9 @@
-"""Utility functions for UV AI Agent."""
\ No newline at end of file
+"""Utility functions for UV AI Agent."""
+
+from .rate_limit import TokenBucketRateLimiter, estimate_tokens, retry_with_backoff
+
+__all__ = [
+    'TokenBucketRateLimiter',
+    'estimate_tokens',
+    'retry_with_backoff'
+]
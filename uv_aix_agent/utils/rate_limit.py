@@ -0,0 +1,80 @@
+"""Rate limiting and retry helpers for LLM calls."""
+
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Tuple, Type
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the token count of a prompt (about four characters per token)."""
+    return len(text) // 4 + 1
+
+
+class TokenBucketRateLimiter:
+    """Async limiter that keeps requests and tokens under per-minute budgets.
+
+    Both budgets refill continuously at rate/60 per second, up to one minute's worth.
+    Callers wait in FIFO order until there is capacity for their request.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._request_capacity = requests_per_minute
+        self._token_capacity = tokens_per_minute
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_capacity = min(
+            self.requests_per_minute,
+            self._request_capacity + elapsed * self.requests_per_minute / 60
+        )
+        self._token_capacity = min(
+            self.tokens_per_minute,
+            self._token_capacity + elapsed * self.tokens_per_minute / 60
+        )
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request and the given number of tokens are available, then take them."""
+        # A request larger than the whole budget would otherwise wait forever
+        tokens = min(tokens, self.tokens_per_minute)
+
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._request_capacity >= 1 and self._token_capacity >= tokens:
+                    self._request_capacity -= 1
+                    self._token_capacity -= tokens
+                    return
+
+                wait = max(
+                    (1 - self._request_capacity) * 60 / self.requests_per_minute,
+                    (tokens - self._token_capacity) * 60 / self.tokens_per_minute,
+                )
+                await asyncio.sleep(max(wait, 0.01))
+
+
+async def retry_with_backoff(
+    func: Callable[..., Awaitable[Any]],
+    *args: Any,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    max_attempts: int = 5,
+    max_wait: float = 60.0,
+) -> Any:
+    """Await func(*args), retrying on the given exceptions with random exponential backoff.
+
+    The delay before retry n is drawn uniformly from [0, min(max_wait, 2**n)] seconds;
+    the last exception is re-raised once max_attempts is reached.
+    """
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return await func(*args)
+        except retry_on:
+            if attempt == max_attempts:
+                raise
+            await asyncio.sleep(random.uniform(0, min(max_wait, 2 ** attempt)))